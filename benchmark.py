@@ -0,0 +1,476 @@
+import gc
+import pickle
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from callofduty import (
+    AuthenticityStamp,
+    Blog,
+    Client,
+    Dump,
+    FeedItem,
+    Leaderboard,
+    LeaderboardEntry,
+    Load,
+    Loadout,
+    LootItem,
+    Match,
+    Player,
+    Season,
+    SocialSnapshot,
+    Squad,
+    StripFeed,
+    Video,
+)
+from callofduty.object import Object
+from callofduty.serialize import _Models
+
+
+class Unslotted:
+    """Stand-in for a model which stores its attributes in a __dict__."""
+
+
+def Unslot(instance: Object) -> Unslotted:
+    """Copy the set attributes of a model into an Unslotted object."""
+
+    unslotted: Unslotted = Unslotted()
+
+    for name, value in instance._Slots():
+        setattr(unslotted, name, value)
+
+    return unslotted
+
+
+def BytesPerInstance(create: Callable[[int], object], count: int) -> float:
+    """Measure the memory retained by each of count instances."""
+
+    gc.collect()
+    tracemalloc.start()
+
+    before: int = tracemalloc.get_traced_memory()[0]
+    instances: List[object] = [create(i) for i in range(count)]
+    after: int = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    del instances
+
+    return (after - before) / count
+
+
+def Memory(count: int = 100_000):
+    models: List[Tuple[str, type, Callable[[type, int], object]]] = [
+        (
+            "Player",
+            Player,
+            lambda cls, i: cls(None, {"platform": "psn", "username": f"Player{i}"}),
+        ),
+        (
+            "LeaderboardEntry",
+            LeaderboardEntry,
+            lambda cls, i: cls(
+                None,
+                {
+                    "platform": "psn",
+                    "username": f"Player{i}",
+                    "rank": i,
+                    "updateTime": 1577836800,
+                    "rating": i * 10,
+                    "values": {},
+                },
+            ),
+        ),
+        (
+            "Match",
+            Match,
+            lambda cls, i: cls(None, {"id": i, "platform": "psn", "title": "mw"}),
+        ),
+    ]
+
+    print(f"Memory per instance ({count:,} instances)")
+
+    for name, cls, create in models:
+        before: float = BytesPerInstance(lambda i: Unslot(create(cls, i)), count)
+        after: float = BytesPerInstance(lambda i: create(cls, i), count)
+
+        print(
+            f"{name:>18}: {before:7.1f} bytes with __dict__, {after:7.1f} bytes with __slots__ ({(1 - after / before):.0%} smaller)"
+        )
+
+
+def Construction(count: int = 1_000):
+    leaderboard: dict = {
+        "title": "mw",
+        "platform": "psn",
+        "leaderboardType": "core",
+        "gameMode": "career",
+        "timeFrame": "alltime",
+        "page": 1,
+        "totalPages": 1000,
+        "columns": ["kills", "deaths"],
+        "entries": [
+            {
+                "username": f"Player{i}",
+                "rank": i,
+                "updateTime": 1577836800,
+                "rating": i * 10,
+                "values": {"kills": i, "deaths": i},
+            }
+            for i in range(100)
+        ],
+    }
+    feed: List[dict] = [
+        {
+            "platform": "psn",
+            "username": f"Player{i}",
+            "title": "mw",
+            "category": "match",
+            "date": 1577836800000,
+            "rendered": f"<p><b>Player{i}</b> won a match of <i>Domination</i></p>",
+            "favorited": False,
+            "meta": {"matchId": str(i)},
+        }
+        for i in range(100)
+    ]
+
+    # Listing workloads which only read the usernames.
+    workloads: List[Tuple[str, Callable[[Client], object]]] = [
+        (
+            "Leaderboard",
+            lambda client: [
+                entry.username for entry in Leaderboard(client, leaderboard).entries
+            ],
+        ),
+        (
+            "FeedItem",
+            lambda client: [FeedItem(client, item).player.username for item in feed],
+        ),
+    ]
+
+    print(f"Construction of {count:,} pages of 100 items, reading usernames")
+
+    for name, workload in workloads:
+        eager: Client = Client(None)
+        lazy: Client = Client(None, lazy=True)
+
+        before: float = timeit.timeit(lambda: workload(eager), number=count)
+        after: float = timeit.timeit(lambda: workload(lazy), number=count)
+
+        print(
+            f"{name:>18}: {before:6.3f}s eager, {after:6.3f}s lazy ({(1 - after / before):.0%} faster)"
+        )
+
+
+def Serialization(count: int = 1_000):
+    client: Client = Client(None)
+    page: Leaderboard = Leaderboard(
+        client,
+        {
+            "title": "mw",
+            "platform": "psn",
+            "leaderboardType": "core",
+            "gameMode": "career",
+            "timeFrame": "alltime",
+            "page": 1,
+            "totalPages": 1000,
+            "columns": ["kills", "deaths"],
+            "entries": [
+                {
+                    "username": f"Player{i}",
+                    "rank": i,
+                    "updateTime": 1577836800,
+                    "rating": i * 10,
+                    "values": {"kills": i, "deaths": i},
+                }
+                for i in range(100)
+            ],
+        },
+    )
+    players: List[Player] = [
+        Player(
+            client,
+            {
+                "platform": "psn",
+                "username": f"Player{i}",
+                "accountId": i,
+                "avatarUrl": f"https://example.com/{i}.png",
+                "online": (i % 2) == 0,
+            },
+        )
+        for i in range(100)
+    ]
+
+    # Round trips of a value, as a worker handing it to another process would.
+    formats: List[Tuple[str, Callable[[object], bytes], Callable[[bytes], object]]] = [
+        ("pickle", pickle.dumps, pickle.loads),
+        ("Dump", Dump, lambda data: Load(data, client)),
+        (
+            "Dump (JSON)",
+            lambda value: Dump(value, binary=False),
+            lambda data: Load(data, client),
+        ),
+    ]
+
+    print(f"Serialization round trips of {count:,} values")
+
+    for name, value in [("Leaderboard", page), ("100 Players", players)]:
+        for fmt, dump, load in formats:
+            size: int = len(dump(value))
+            elapsed: float = timeit.timeit(lambda: load(dump(value)), number=count)
+
+            print(
+                f"{name:>18}: {fmt:<12} {size:7,} bytes, {(count / elapsed):8,.0f} round trips/s"
+            )
+
+
+def Snapshot(value: Any) -> Any:
+    """Reduce a value to comparable data, including the set slots of models."""
+
+    if isinstance(value, Object):
+        return (
+            value._type,
+            {
+                name: Snapshot(slot)
+                for name, slot in value._Slots()
+                if (name not in value._transient) and (name != "_client")
+            },
+        )
+    elif isinstance(value, (list, tuple)):
+        return [Snapshot(i) for i in value]
+    elif isinstance(value, dict):
+        return {key: Snapshot(i) for key, i in value.items()}
+
+    return value
+
+
+def RoundTrips():
+    client: Client = Client(None)
+    weapon: dict = {
+        "id": "iw8_ar_m4",
+        "variant": {"id": 1},
+        "optic": {"id": "optic"},
+        "operatorMod": None,
+        "attachments": [{"id": "barrel"}],
+        "camoEquipped": "gold",
+    }
+    leaderboard: Leaderboard = Leaderboard(
+        client,
+        {
+            "title": "mw",
+            "platform": "psn",
+            "leaderboardType": "core",
+            "gameMode": "career",
+            "timeFrame": "alltime",
+            "page": 1,
+            "totalPages": 1000,
+            "columns": ["kills"],
+            "entries": [
+                {
+                    "username": "Player",
+                    "rank": 1,
+                    "updateTime": 1577836800,
+                    "rating": 10,
+                    "values": {"kills": 1},
+                }
+            ],
+        },
+    )
+    player: Player = Player(
+        client, {"platform": "psn", "username": "Player", "online": False}
+    )
+    feed: List[FeedItem] = [
+        FeedItem(
+            client,
+            {
+                "platform": "psn",
+                "username": "Player",
+                "title": "mw",
+                "category": "match",
+                "date": 1577836800000,
+                "rendered": "<p><b>Player</b> won a match</p>",
+                "favorited": False,
+                "meta": {"matchId": "1"},
+            },
+        )
+    ]
+    squad: Squad = Squad(
+        client,
+        {
+            "hash": "1",
+            "name": "Squad",
+            "creator": {
+                "platform": "psn",
+                "gamerTag": "Owner",
+                "platformId": 1,
+                "avatarUrl": None,
+            },
+            "members": [],
+        },
+    )
+    loot: dict = {
+        "name": "item",
+        "label": "Item",
+        "type": "camo",
+        "rarity": "rare",
+        "tier": "1",
+        "image": "item.png",
+    }
+
+    # Slots assigned after construction, as by the identity index,
+    # StripFeed and SquadWatcher, which must survive the round trip.
+    player.online = True
+    StripFeed(feed)
+    squad.members = [squad.owner]
+
+    # Every model, materialized so that its set slots are compared.
+    models: List[Object] = [
+        leaderboard,
+        *leaderboard.entries,
+        player,
+        *feed,
+        squad,
+        Match(client, {"id": 1, "platform": "psn", "title": "mw"}),
+        Blog(
+            client,
+            {
+                "title": "Blog",
+                "html": "<p>Blog</p>",
+                "url": "https://example.com",
+                "dimg": "blog.png",
+                "metadata": {"contentItemType": "news"},
+                "publishedDate": {
+                    "year": 2020,
+                    "month": 1,
+                    "dayOfMonth": 1,
+                    "hourOfDay": 0,
+                    "minute": 0,
+                    "second": 0,
+                },
+            },
+        ),
+        Video(
+            client,
+            {
+                "title": "Video",
+                "description": "Video",
+                "youtubeId": "id",
+                "length": 60,
+                "image": "video.png",
+                "categories": [],
+            },
+        ),
+        SocialSnapshot(client, {"uno": []}, 0.0),
+        Loadout(
+            client,
+            {
+                "customClassName": "Class",
+                "primaryWeapon": weapon,
+                "secondaryWeapon": weapon,
+                "equipment": {"id": "frag"},
+                "gear": None,
+                "perks": [{"id": "perk"}],
+                "wildcards": [],
+                "unlocked": True,
+            },
+        ),
+        AuthenticityStamp(
+            client,
+            {
+                "platform": "psn",
+                "username": "Player",
+                "title": "bo4",
+                "mode": "mp",
+                "partyMembers": ["Player"],
+                "partyMembersLeft": [],
+                "gameSettings": {},
+                "playerStats": {},
+            },
+        ),
+        Season(
+            client,
+            {
+                "title": "mw",
+                "season": 1,
+                "platform": "psn",
+                "tiers": {"1": loot},
+                "chase": {},
+                "language": "en",
+            },
+        ),
+        LootItem(client, loot),
+    ]
+
+    for model in models:
+        for name in model._fields:
+            getattr(model, name)
+
+        # The weapons and items of a loadout are only models within it.
+        if isinstance(model, Loadout):
+            models.extend((model.primary, *model.perks))
+
+    missing: set = set(_Models()) - {model._type for model in models}
+    assert len(missing) == 0, f"No round trip check for {', '.join(missing)}"
+
+    formats: List[Tuple[str, Callable[[Any], Any]]] = [
+        ("pickle", lambda value: pickle.loads(pickle.dumps(value))),
+        ("Dump", lambda value: Load(Dump(value), client)),
+        ("Dump (JSON)", lambda value: Load(Dump(value, binary=False), client)),
+    ]
+    values: Dict[str, Any] = {
+        **{model._type: model for model in models},
+        "Leaderboard entries": leaderboard.entries,
+    }
+
+    print(f"Round trips of {len(values)} values")
+
+    for name, value in values.items():
+        for fmt, roundTrip in formats:
+            assert Snapshot(roundTrip(value)) == Snapshot(value), f"{name}: {fmt}"
+
+        print(f"{name:>20}: identical with {', '.join(fmt for fmt, _ in formats)}")
+
+
+def Stripping(count: int = 1_000):
+    client: Client = Client(None)
+    feed: List[dict] = [
+        {
+            "platform": "psn",
+            "username": f"Player{i}",
+            "title": "mw",
+            "category": "match",
+            "date": 1577836800000,
+            "rendered": f"<p><b>Player{i}</b> won a match of <i>Domination</i> &amp; ranked up</p>",
+            "favorited": False,
+            "meta": {"matchId": str(i)},
+        }
+        for i in range(100)
+    ]
+
+    # Parsing a feed page, then reading the text of each item either one
+    # at a time or all at once.
+    workloads: List[Tuple[str, Callable[[], object]]] = [
+        ("Parse", lambda: [FeedItem(client, item) for item in feed]),
+        (
+            "Parse, text",
+            lambda: [FeedItem(client, item).text for item in feed],
+        ),
+        (
+            "Parse, StripFeed",
+            lambda: StripFeed([FeedItem(client, item) for item in feed]),
+        ),
+    ]
+
+    print(f"Stripping HTML of {count:,} feed pages of 100 items")
+
+    for name, workload in workloads:
+        elapsed: float = timeit.timeit(workload, number=count)
+
+        print(f"{name:>18}: {elapsed:6.3f}s")
+
+
+if __name__ == "__main__":
+    Memory()
+    Construction()
+    Serialization()
+    RoundTrips()
+    Stripping()
@@ -7,18 +7,36 @@ GitHub: https://github.com/EthanC/CallofDuty.py
 
 import logging
 
-from .auth import Login
+from .auth import Login, Offline
+from .bulk import ProfileResult
+from .cache import ClassifyError, NegativeCache
+from .capture import Capture
 from .client import Client
 from .enums import *
 from .errors import *
-from .feed import Blog, FeedItem, Video
+from .feed import Blog, FeedItem, StripFeed, Video
+from .identity import IdentityIndex
 from .leaderboard import Leaderboard, LeaderboardEntry
 from .loadout import Loadout, LoadoutItem, LoadoutWeapon
+from .localize import Localization
 from .loot import LootItem, Season
 from .match import Match
 from .player import Player
+from .search import PlayerSearch
+from .scheduler import ActivityScheduler, ActivityScore, ScheduledPlayer
+from .serialize import Dump, Load
+from .social import SocialSnapshot
 from .squad import Squad
 from .stamp import AuthenticityStamp
+from .watch import (
+    FeedPoller,
+    ProfileChange,
+    ProfileDelta,
+    ProfileWatcher,
+    SquadEvent,
+    SquadWatcher,
+    Watcher,
+)
 
 try:
     from logging import NullHandler
@@ -4,6 +4,7 @@ from typing import Dict, Optional
 
 import httpx
 
+from .capture import Capture
 from .client import Client
 from .errors import LoginFailure
 from .http import HTTP
@@ -113,7 +114,7 @@ class Auth:
                 raise LoginFailure(f"Failed to login (HTTP {res.status_code})")
 
 
-async def Login(email: str, password: str) -> Client:
+async def Login(email: str, password: str, **kwargs) -> Client:
     """
     Convenience function to make login with the Call of Duty authorization flow
     as easy as possible.
@@ -124,6 +125,12 @@ async def Login(email: str, password: str) -> Client:
         Activision account email address.
     password : str
         Activision account password.
+    warmUp : bool, optional
+        Boolean indicating whether or not Client.WarmUp is awaited before
+        the client is returned (default is False.)
+    **kwargs
+        Options which are passed to the HTTP client and Client, see
+        callofduty.HTTP and callofduty.Client.
 
     Returns
     -------
@@ -136,4 +143,37 @@ async def Login(email: str, password: str) -> Client:
     await auth.RegisterDevice()
     await auth.SubmitLogin()
 
-    return Client(HTTP(auth))
+    client: Client = Client(HTTP(auth, **kwargs), **kwargs)
+
+    if kwargs.get("warmUp", False) is True:
+        await client.WarmUp()
+
+    return client
+
+
+def Offline(path: str, **kwargs) -> Client:
+    """
+    Convenience function to create a client which serves every request from
+    a previously recorded capture, without network access or authentication.
+
+    Responses are recorded by passing capture to Login, any request which
+    was not recorded raises CacheMiss.
+
+    Parameters
+    ----------
+    path : str
+        Path of the capture file.
+    **kwargs
+        Options which are passed to the HTTP client and Client, see
+        callofduty.HTTP and callofduty.Client.
+
+    Returns
+    -------
+    object
+        Offline Call of Duty client.
+    """
+
+    kwargs["capture"] = Capture(path)
+    kwargs["offline"] = True
+
+    return Client(HTTP(None, **kwargs), **kwargs)
@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+
+from .enums import Outcome, Platform
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class ProfileResult:
+    """
+    Represents the outcome of requesting a single player's profile as part
+    of a bulk request.
+
+    Parameters
+    ----------
+    platform : callofduty.Platform
+        Platform of the player.
+    username : str
+        Player's username for the designated platform.
+    outcome : callofduty.Outcome
+        Outcome of the request for the player's profile.
+    profile : dict, optional
+        JSON data of the player's profile if successful (default is None.)
+    error : Exception, optional
+        Exception which caused the request to fail (default is None.)
+    """
+
+    __slots__ = ("platform", "username", "outcome", "profile", "error")
+
+    def __init__(self, platform: Platform, username: str, outcome: Outcome, **kwargs):
+        self.platform: Platform = platform
+        self.username: str = username
+        self.outcome: Outcome = outcome
+        self.profile: Optional[dict] = kwargs.get("profile")
+        self.error: Optional[Exception] = kwargs.get("error")
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome is Outcome.Success
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.platform.name}/{self.username} {self.outcome.name}>"
+
+    def __str__(self) -> str:
+        return self.__repr__()
@@ -0,0 +1,335 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from .enums import Outcome
+from .errors import Forbidden, HTTPException, NotFound
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+def ClassifyError(error: HTTPException) -> Optional[Outcome]:
+    """
+    Classify a failed HTTP request by whether or not repeating it could
+    succeed.
+
+    Parameters
+    ----------
+    error : callofduty.HTTPException
+        Exception raised by the failed request.
+
+    Returns
+    -------
+    callofduty.Outcome
+        NotFound for unknown resources, Forbidden for private or otherwise
+        inaccessible resources, Error for any other error reported by the
+        API, None for transient failures such as rate limiting.
+    """
+
+    # Error bodies are raised as HTTPException before the status code is
+    # checked, so the status code is used in addition to the type.
+    if isinstance(error, NotFound) or (error.statusCode == 404):
+        return Outcome.NotFound
+    elif isinstance(error, Forbidden) or (error.statusCode == 403):
+        return Outcome.Forbidden
+
+    # The API tends to return HTTP 200 even when an error occurs, in which
+    # case the message is the only indication of what went wrong.
+    if 300 > error.statusCode >= 200:
+        message: str = str(error).lower()
+
+        if "not found" in message:
+            return Outcome.NotFound
+        elif ("not permitted" in message) or ("not allowed" in message):
+            return Outcome.Forbidden
+
+        return Outcome.Error
+
+    return None
+
+
+class NegativeCache:
+    """
+    Cache of failed HTTP requests, which raises the previous error for
+    repeated requests rather than sending them again.
+
+    Only GET requests to the configured routes are cached, as the mutating
+    endpoints of the Call of Duty API are also GET requests. Transient
+    failures, such as rate limiting and server errors, are never cached.
+
+    Parameters
+    ----------
+    ttl : dict, optional
+        Number of seconds to cache each Outcome for, merged with the
+        defaults (default is 600 for NotFound, 300 for Forbidden, and 60
+        for Error.)
+    routes : dict, optional
+        Per-route overrides of ttl, keyed by the name of the HTTP method,
+        merged with the default routes (default is the player and match
+        lookups.) Set a route to None to disable caching of it.
+    maxSize : int, optional
+        Maximum number of entries, expired entries are purged first and
+        then the least recently stored are evicted (default is 4096.)
+    """
+
+    defaultTTL: Dict[Outcome, float] = {
+        Outcome.NotFound: 600,
+        Outcome.Forbidden: 300,
+        Outcome.Error: 60,
+    }
+    defaultRoutes: Tuple[str, ...] = (
+        "SearchPlayer",
+        "GetPlayerProfile",
+        "GetPlayerMatches",
+        "GetPlayerMatchesDetailed",
+        "GetMatch",
+        "GetPlayerLeaderboard",
+        "GetPlayerLoadouts",
+        "GetSquad",
+        "GetPlayerSquad",
+    )
+
+    def __init__(self, **kwargs):
+        self.ttl: Dict[Outcome, float] = {**self.defaultTTL, **kwargs.get("ttl", {})}
+        self.routes: Dict[str, Optional[Dict[Outcome, float]]] = {
+            route: {} for route in self.defaultRoutes
+        }
+        self.routes.update(kwargs.get("routes", {}))
+        self.maxSize: int = kwargs.get("maxSize", 4096)
+
+        self._entries: Dict[Tuple[str, str], Tuple[float, HTTPException]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def TTL(self, route: Optional[str], outcome: Outcome) -> Optional[float]:
+        """Get the number of seconds to cache an Outcome of a route for."""
+
+        if (route is None) or ((overrides := self.routes.get(route)) is None):
+            return None
+
+        return overrides.get(outcome, self.ttl.get(outcome))
+
+    def Get(self, req) -> Optional[HTTPException]:
+        """
+        Get the cached error of a request.
+
+        Parameters
+        ----------
+        req : callofduty.HTTP.Request
+            Object representing the HTTP request.
+
+        Returns
+        -------
+        callofduty.HTTPException
+            New exception equivalent to the cached error, None if the
+            request is not cached or has expired.
+        """
+
+        if (req.method != "GET") or (req.route is None):
+            return None
+
+        key: Tuple[str, str] = (req.route, req.url)
+
+        if (cached := self._entries.get(key)) is None:
+            return None
+
+        expires, error = cached
+
+        if time.monotonic() >= expires:
+            del self._entries[key]
+
+            return None
+
+        log.debug(f"Negative cache hit for {req.route} {req.url}")
+
+        # Raising the cached exception itself would chain each traceback
+        # onto the last, so a fresh exception of the same type is returned.
+        return error.__class__(error.statusCode, error.res)
+
+    def Put(self, req, error: HTTPException) -> bool:
+        """
+        Cache the error of a failed request, if it is not transient.
+
+        Parameters
+        ----------
+        req : callofduty.HTTP.Request
+            Object representing the HTTP request.
+        error : callofduty.HTTPException
+            Exception raised by the request.
+
+        Returns
+        -------
+        bool
+            Boolean indicating whether or not the error was cached.
+        """
+
+        if (req.method != "GET") or ((outcome := ClassifyError(error)) is None):
+            return False
+
+        if (ttl := self.TTL(req.route, outcome)) is None or ttl <= 0:
+            return False
+
+        key: Tuple[str, str] = (req.route, req.url)
+        self._entries.pop(key, None)
+
+        if len(self._entries) >= self.maxSize:
+            self.Purge()
+
+            while len(self._entries) >= self.maxSize:
+                del self._entries[next(iter(self._entries))]
+
+        self._entries[key] = (time.monotonic() + ttl, error)
+
+        return True
+
+    def Purge(self):
+        """Remove all expired entries from the cache."""
+
+        now: float = time.monotonic()
+
+        for key in [k for k, (expires, _) in self._entries.items() if now >= expires]:
+            del self._entries[key]
+
+    def Invalidate(self, routes: Optional[Iterable[str]] = None):
+        """
+        Remove cached errors.
+
+        Parameters
+        ----------
+        routes : iterable, optional
+            Names of the routes to remove errors of (default is all routes.)
+        """
+
+        if routes is None:
+            self._entries.clear()
+
+            return
+
+        routes = set(routes)
+
+        for key in [k for k in self._entries if k[0] in routes]:
+            del self._entries[key]
+
+
+class StaleCache:
+    """
+    Client-side cache which, once an entry expires, returns it immediately
+    while a single background refresh replaces it.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Number of seconds an entry is fresh for, 0 to disable the cache
+        (default is 0.)
+    maxStale : float, optional
+        Number of seconds after expiring that an entry may still be served
+        while it is refreshed, beyond which callers wait for the refresh
+        (default is 300.)
+    maxSize : int, optional
+        Maximum number of entries, the least recently stored of which are
+        evicted first (default is 1024.)
+    """
+
+    def __init__(self, **kwargs):
+        self.ttl: float = kwargs.get("ttl", 0)
+        self.maxStale: float = kwargs.get("maxStale", 300)
+        self.maxSize: int = kwargs.get("maxSize", 1024)
+
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def Get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get an entry of the cache, fetching it if it is missing or too stale.
+
+        Parameters
+        ----------
+        key : object
+            Hashable key of the entry.
+        fetch : callable
+            Coroutine function which fetches the value of the entry.
+
+        Returns
+        -------
+        object
+            Value of the entry. The returned object is shared between
+            calls, so it should not be modified.
+        """
+
+        if self.ttl <= 0:
+            return await fetch()
+
+        if (entry := self._entries.get(key)) is not None:
+            age: float = time.monotonic() - entry[0]
+
+            if age < self.ttl:
+                return entry[1]
+            elif age < (self.ttl + self.maxStale):
+                self._Refresh(key, fetch)
+
+                return entry[1]
+
+        return await asyncio.shield(self._Refresh(key, fetch))
+
+    def Invalidate(self, key: Optional[Hashable] = None):
+        """
+        Remove entries from the cache.
+
+        Parameters
+        ----------
+        key : object, optional
+            Key of the entry to remove (default is all entries.)
+        """
+
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def _Refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Future:
+        """Fetch an entry, unless a fetch of it is already in flight."""
+
+        if (pending := self._pending.get(key)) is None:
+            pending = asyncio.ensure_future(self._Fetch(key, fetch))
+            pending.add_done_callback(self._Fetched)
+
+            self._pending[key] = pending
+
+        return pending
+
+    async def _Fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value: Any = await fetch()
+        finally:
+            self._pending.pop(key, None)
+
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic(), value)
+
+        while len(self._entries) > self.maxSize:
+            del self._entries[next(iter(self._entries))]
+
+        return value
+
+    @staticmethod
+    def _Fetched(fut: asyncio.Future):
+        # Retrieve the exceptions of background refreshes which nobody is
+        # waiting on, the stale entry remains until maxStale is exceeded.
+        if (not fut.cancelled()) and ((e := fut.exception()) is not None):
+            log.debug(f"Failed to refresh cache entry, {e}")
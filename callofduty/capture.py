@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+from typing import Dict, Tuple, Union
+
+from .errors import CacheMiss
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class Capture:
+    """
+    Record of Call of Duty API responses, persisted to a JSON Lines file,
+    which an offline HTTP client serves requests from.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to append responses to. Responses which the file
+        already contains are loaded, the latest of each request winning.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+
+        # Responses are kept serialized so that every replay returns a new
+        # object, which consumers are free to modify.
+        self._responses: Dict[str, Tuple[int, str]] = {}
+
+        if os.path.exists(path):
+            self.Load()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def __contains__(self, req) -> bool:
+        return self.Key(req) in self._responses
+
+    @staticmethod
+    def Key(req) -> str:
+        """Get the capture key of a request."""
+
+        if not req.json:
+            return f"{req.method} {req.url}"
+
+        return f"{req.method} {req.url} {json.dumps(req.json, sort_keys=True)}"
+
+    def Load(self):
+        """Load the responses which the capture file contains."""
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+
+                entry: dict = json.loads(line)
+
+                self._responses[entry["key"]] = (
+                    entry["statusCode"],
+                    json.dumps(entry["data"]),
+                )
+
+        log.debug(f"Loaded {len(self._responses)} responses from {self.path}")
+
+    def Record(self, req, statusCode: int, data: Union[dict, str]):
+        """
+        Record the response of a request, appending it to the capture file.
+
+        Parameters
+        ----------
+        req : callofduty.HTTP.Request
+            Object representing the HTTP request.
+        statusCode : int
+            HTTP status code of the response.
+        data : dict/str
+            Response of the HTTP request.
+        """
+
+        key: str = self.Key(req)
+        serialized: str = json.dumps(data)
+
+        self._responses[key] = (statusCode, serialized)
+
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(
+                f'{{"key": {json.dumps(key)}, "statusCode": {statusCode}, "data": {serialized}}}\n'
+            )
+
+    def Replay(self, req) -> Tuple[int, Union[dict, str]]:
+        """
+        Get the recorded response of a request.
+
+        Parameters
+        ----------
+        req : callofduty.HTTP.Request
+            Object representing the HTTP request.
+
+        Returns
+        -------
+        tuple
+            HTTP status code and response of the HTTP request.
+        """
+
+        try:
+            statusCode, serialized = self._responses[self.Key(req)]
+        except KeyError:
+            raise CacheMiss(f"No captured response for {req.method} {req.url}")
+
+        return statusCode, json.loads(serialized)
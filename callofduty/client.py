@@ -1,16 +1,45 @@
+import asyncio
 import logging
-from typing import List, Optional, Union
+import time
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from .enums import GameType, Language, Mode, Platform, Reaction, TimeFrame, Title
+from .bulk import ProfileResult
+from .cache import ClassifyError, StaleCache
+from .enums import (
+    GameType,
+    Language,
+    Mode,
+    Outcome,
+    Platform,
+    Reaction,
+    TimeFrame,
+    Title,
+)
+from .errors import HTTPException
 from .feed import Blog, FeedItem, Video
+from .identity import IdentityIndex
 from .leaderboard import Leaderboard
 from .loadout import Loadout, LoadoutItem
+from .localize import Localization
 from .loot import Season
 from .match import Match
 from .player import Player
+from .search import PlayerSearch
+from .social import SocialSnapshot
 from .squad import Squad
 from .stamp import AuthenticityStamp
 from .utils import (
+    Convert,
     VerifyGameType,
     VerifyLanguage,
     VerifyMode,
@@ -24,10 +53,145 @@ log: logging.Logger = logging.getLogger(__name__)
 
 
 class Client:
-    """Client which manages communication with the Call of Duty API."""
-
-    def __init__(self, http):
+    """
+    Client which manages communication with the Call of Duty API.
+
+    Parameters
+    ----------
+    http : callofduty.HTTP
+        HTTP client used to communicate with the Call of Duty API.
+    socialTTL : float, optional
+        Number of seconds for which GetMyFriends and GetMyFriendRequests
+        reuse the previous Friends compendium (default is 0, disabled.)
+    localizeTTL : float, optional
+        Number of seconds for which the localized strings of each language
+        are cached (default is 3600.)
+    profileTTL : float, optional
+        Number of seconds for which GetPlayerProfile results are fresh,
+        after which they are served stale while refreshed in the
+        background (default is 0, disabled.)
+    leaderboardTTL : float, optional
+        Number of seconds for which GetLeaderboard results are fresh, as
+        with profileTTL (default is 0, disabled.)
+    maxStale : float, optional
+        Number of seconds after expiring that profiles and leaderboards may
+        still be served while they are refreshed (default is 300.)
+    searchTTL : float, optional
+        Number of seconds for which player search results are cached by
+        Client.search (default is 60.)
+    debounce : float, optional
+        Number of seconds which Client.search waits for further input
+        before searching (default is 0.2.)
+    identityIndex : bool, optional
+        Boolean indicating whether or not the identities seen in responses
+        are recorded in Client.identities (default is False.)
+    identityPath : str, optional
+        Path of a file previously written by IdentityIndex.Save to load
+        into Client.identities, enables identityIndex (default is None.)
+    identitySize : int, optional
+        Maximum number of identities recorded in Client.identities, the
+        least recently seen of which are evicted first (default is 65536.)
+    internPlayers : bool, optional
+        Boolean indicating whether or not each player identity is returned
+        as a single Player object across responses, into which newly seen
+        fields are merged, enables identityIndex (default is False.)
+    lazy : bool, optional
+        Boolean indicating whether or not the fields of returned objects are
+        materialized upon first access rather than upon construction
+        (default is False.)
+    mapsTTL : float, optional
+        Number of seconds for which GetAvailableMaps results are fresh, as
+        with profileTTL (default is 3600.)
+    preloadLanguages : list, optional
+        Languages of the localized strings which WarmUp preloads (default
+        is None.)
+    preloadMaps : list, optional
+        (Title, Mode) tuples of the available maps which WarmUp preloads
+        (default is None.)
+    """
+
+    def __init__(self, http, **kwargs):
         self.http = http
+        self.lazy: bool = kwargs.get("lazy", False)
+
+        self.socialTTL: float = kwargs.get("socialTTL", 0)
+        self.localizeTTL: float = kwargs.get("localizeTTL", 3600)
+
+        self._social: Optional[Tuple[float, asyncio.Future]] = None
+        self._localize: Dict[Language, Tuple[float, asyncio.Future]] = {}
+
+        self.profileCache: StaleCache = StaleCache(
+            ttl=kwargs.get("profileTTL", 0), maxStale=kwargs.get("maxStale", 300)
+        )
+        self.leaderboardCache: StaleCache = StaleCache(
+            ttl=kwargs.get("leaderboardTTL", 0), maxStale=kwargs.get("maxStale", 300)
+        )
+        self.mapsCache: StaleCache = StaleCache(
+            ttl=kwargs.get("mapsTTL", 3600), maxStale=kwargs.get("maxStale", 300)
+        )
+
+        self.preloadLanguages: List[Language] = kwargs.get("preloadLanguages", [])
+        self.preloadMaps: List[Tuple[Title, Mode]] = kwargs.get("preloadMaps", [])
+
+        self.search: PlayerSearch = PlayerSearch(
+            self,
+            ttl=kwargs.get("searchTTL", 60),
+            debounce=kwargs.get("debounce", 0.2),
+        )
+
+        self.identities: Optional[IdentityIndex] = None
+
+        if (
+            (kwargs.get("identityIndex", False) is True)
+            or (kwargs.get("internPlayers", False) is True)
+            or (kwargs.get("identityPath") is not None)
+        ):
+            self.identities = IdentityIndex(
+                self,
+                intern=kwargs.get("internPlayers", False),
+                maxSize=kwargs.get("identitySize", 65536),
+            )
+
+            if (path := kwargs.get("identityPath")) is not None:
+                self.identities.Load(path)
+
+    async def WarmUp(self, **kwargs):
+        """
+        Open connections to the Call of Duty API and preload static
+        resources in parallel, so that subsequent requests are not slowed
+        by connection setup or cold caches.
+
+        Parameters
+        ----------
+        languages : list, optional
+            Languages of the localized strings to preload (default is
+            Client.preloadLanguages.)
+        maps : list, optional
+            (Title, Mode) tuples of the available maps to preload (default
+            is Client.preloadMaps.)
+        """
+
+        languages: List[Language] = kwargs.get("languages", self.preloadLanguages)
+        maps: List[Tuple[Title, Mode]] = kwargs.get("maps", self.preloadMaps)
+
+        # Connections are opened first so that the preloads reuse them,
+        # rather than racing to open their own.
+        await self.http.WarmUp()
+
+        results: list = await asyncio.gather(
+            *[self.GetLocalize(language) for language in languages],
+            *[self.GetAvailableMaps(title, mode=mode) for title, mode in maps],
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                log.warning(f"Failed to preload static resource, {result}")
+
+    async def Close(self):
+        """Close the HTTP session, along with its open connections."""
+
+        await self.http.Close()
 
     async def GetLocalize(self, language: Language = Language.English) -> dict:
         """
@@ -42,15 +206,65 @@ class Client:
         Returns
         -------
         dict
-            JSON data containing localized strings.
+            JSON data containing localized strings. The returned object is
+            cached and shared between calls, so it should not be modified.
         """
 
-        #VerifyLanguage(language)
+        VerifyLanguage(language)
+
+        cached: Optional[Tuple[float, asyncio.Future]] = self._localize.get(language)
+
+        if (cached is None) or (
+            cached[1].done() and ((time.monotonic() - cached[0]) >= self.localizeTTL)
+        ):
+            cached = (
+                time.monotonic(),
+                asyncio.ensure_future(self._GetLocalize(language)),
+            )
+            self._localize[language] = cached
+
+        try:
+            return await asyncio.shield(cached[1])
+        except Exception:
+            if self._localize.get(language) is cached:
+                del self._localize[language]
+
+            raise
+
+    async def _GetLocalize(self, language: Language) -> Localization:
+        """Request and merge the website and Companion App localizations."""
+
+        web, app = await asyncio.gather(
+            self.http.GetWebLocalize(language.value),
+            self.http.GetAppLocalize(language.value),
+        )
+
+        localize: Localization = Localization(web)
+        localize.update(app)
+
+        return localize
+
+    async def GetLocalizedString(
+        self, key: str, language: Language = Language.English
+    ) -> Optional[str]:
+        """
+        Translate a stat or item key using the localized strings used by
+        the Call of Duty Companion App and website.
+
+        Parameters
+        ----------
+        key : str
+            Key of the localized string, matched case-insensitively.
+        language : callofduty.Language, optional
+            Language to use for localization data (default is English.)
 
-        web: dict = await self.http.GetWebLocalize(language.value)
-        app: dict = await self.http.GetAppLocalize(language.value)
+        Returns
+        -------
+        str
+            Localized string for the key, or None if it isn't localized.
+        """
 
-        return {**web, **app}
+        return (await self.GetLocalize(language)).Translate(key)
 
     async def GetNewsFeed(
         self, language: Language = Language.English, **kwargs
@@ -71,16 +285,18 @@ class Client:
             Array of Blog objects.
         """
 
-        #VerifyLanguage(language)
+        VerifyLanguage(language)
 
         data: dict = await self.http.GetNewsFeed(language.value)
 
+        posts: List[dict] = data["blog"]
+
         limit: int = kwargs.get("limit", 0)
         if limit > 0:
-            data["blog"] = data["blog"][:limit]
+            posts = posts[:limit]
 
         blogs: List[Blog] = []
-        for _post in data["blog"]:
+        for _post in posts:
             blogs.append(Blog(self, _post))
 
         return blogs
@@ -104,7 +320,7 @@ class Client:
             Array of Video objects.
         """
 
-        #VerifyLanguage(language)
+        VerifyLanguage(language)
 
         data: dict = (await self.http.GetVideoFeed(language.value))["videos"]
 
@@ -177,9 +393,9 @@ class Client:
         None
         """
 
-        #VerifyReaction(reaction)
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyReaction(reaction)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         json: dict = {
             "username": username,
@@ -220,8 +436,8 @@ class Client:
         None
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         json: dict = {
             "username": username,
@@ -262,8 +478,8 @@ class Client:
         None
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         json: dict = {
             "username": username,
@@ -304,8 +520,8 @@ class Client:
         None
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         json: dict = {
             "username": username,
@@ -334,8 +550,8 @@ class Client:
         for identity in data["titleIdentities"]:
             identities.append(
                 {
-                    "title": Title(identity.pop("title")),
-                    "platform": Platform(identity.pop("platform")),
+                    "title": Convert(Title, identity["title"]),
+                    "platform": Convert(Platform, identity["platform"]),
                     "username": identity["username"],
                     "activeDate": identity["activeDate"],
                     "activityType": identity["activityType"],
@@ -365,118 +581,97 @@ class Client:
                 )
             )
 
-        return accounts
+        return self._Record(accounts)
 
-    async def GetMyFriends(self) -> List[Player]:
+    async def GetSocialSnapshot(self, **kwargs) -> SocialSnapshot:
         """
-        Get the Friends of the authenticated Call of Duty player.
+        Get a snapshot of the Friends compendium for the authenticated Call
+        of Duty player, which contains the friends, incoming and outgoing
+        Friend Requests, and blocked players in a single request.
+
+        Parameters
+        ----------
+        maxAge : float, optional
+            Number of seconds for which a previous snapshot may be reused
+            rather than requesting a new one (default is 0.)
 
         Returns
         -------
-        list
-            Array of Player objects for the friends.
+        object
+            SocialSnapshot object for the authenticated player.
         """
 
-        data: dict = (await self.http.GetMyFriends())["data"]
+        maxAge: float = kwargs.get("maxAge", 0)
 
-        friends: List[Player] = []
+        cached: Optional[Tuple[float, asyncio.Future]] = self._social
 
-        for friend in data["uno"]:
-            friends.append(
-                Player(
-                    self,
-                    {
-                        "platform": friend["platform"],
-                        "username": friend["username"],
-                        "accountId": friend.get("accountId"),
-                        "online": friend["status"]["online"],
-                    },
-                )
+        # An in-flight request is always reused, a completed one only
+        # while it is younger than maxAge.
+        if (cached is None) or (
+            cached[1].done() and ((time.monotonic() - cached[0]) >= maxAge)
+        ):
+            created: float = time.monotonic()
+
+            cached = (
+                created,
+                asyncio.ensure_future(self.http.GetMyFriends()),
             )
+            self._social = cached
 
-        for _platform in data["firstParty"]:
-            for friend in data["firstParty"][_platform]:
-                i: list = friend.get("identities", [])
-                identities: List[Player] = []
-
-                for _platform in i:
-                    identities.append(
-                        Player(
-                            self,
-                            {
-                                "platform": friend["identities"][_platform]["platform"],
-                                "username": friend["identities"][_platform].get(
-                                    "username"
-                                ),
-                                "accountId": friend["identities"][_platform][
-                                    "accountId"
-                                ],
-                                "avatarUrl": friend["identities"][_platform].get(
-                                    "avatarUrlLargeSsl"
-                                ),
-                            },
-                        )
-                    )
+        try:
+            data: dict = (await asyncio.shield(cached[1]))["data"]
+        except Exception:
+            if self._social is cached:
+                self._social = None
 
-                friends.append(
-                    Player(
-                        self,
-                        {
-                            "platform": friend["platform"],
-                            "username": friend["username"],
-                            "accountId": friend.get("accountId"),
-                            "avatarUrl": friend.get("avatarUrlLargeSsl"),
-                            "online": friend["status"]["online"],
-                            "identities": identities,
-                        },
-                    )
-                )
+            raise
 
-        return friends
+        return SocialSnapshot(self, data, cached[0])
 
-    async def GetMyFriendRequests(self) -> dict:
+    async def GetMyFriends(self, **kwargs) -> List[Player]:
+        """
+        Get the Friends of the authenticated Call of Duty player.
+
+        Parameters
+        ----------
+        maxAge : float, optional
+            Number of seconds for which a previous Friends compendium may be
+            reused (default is the client's socialTTL.)
+
+        Returns
+        -------
+        list
+            Array of Player objects for the friends.
+        """
+
+        snapshot: SocialSnapshot = await self.GetSocialSnapshot(
+            maxAge=kwargs.get("maxAge", self.socialTTL)
+        )
+
+        return snapshot.friends
+
+    async def GetMyFriendRequests(self, **kwargs) -> dict:
         """
         Get the incoming and outgoing Friend Requests for the authenticated
         Call of Duty player.
 
+        Parameters
+        ----------
+        maxAge : float, optional
+            Number of seconds for which a previous Friends compendium may be
+            reused (default is the client's socialTTL.)
+
         Returns
         -------
         dict
             JSON data of the player's friend requests.
         """
 
-        data: dict = (await self.http.GetMyFriends())["data"]
-
-        incoming: List[Player] = []
-        outgoing: List[Player] = []
-
-        for request in data["incomingInvitations"]:
-            incoming.append(
-                Player(
-                    self,
-                    {
-                        "platform": request["platform"],
-                        "username": request["username"],
-                        "accountId": request.get("accountId"),
-                        "online": request["status"]["online"],
-                    },
-                )
-            )
-
-        for request in data["outgoingInvitations"]:
-            outgoing.append(
-                Player(
-                    self,
-                    {
-                        "platform": request["platform"],
-                        "username": request["username"],
-                        "accountId": request.get("accountId"),
-                        "online": request["status"]["online"],
-                    },
-                )
-            )
+        snapshot: SocialSnapshot = await self.GetSocialSnapshot(
+            maxAge=kwargs.get("maxAge", self.socialTTL)
+        )
 
-        return {"incoming": incoming, "outgoing": outgoing}
+        return {"incoming": snapshot.incoming, "outgoing": snapshot.outgoing}
 
     async def GetMyFavorites(self) -> List[Player]:
         """
@@ -521,7 +716,7 @@ class Client:
             Player object for the requested player.
         """
 
-        #VerifyPlatform(platform)
+        VerifyPlatform(platform)
 
         return Player(self, {"platform": platform.value, "username": username})
 
@@ -546,7 +741,7 @@ class Client:
             Array of Player objects matching the query.
         """
 
-        #VerifyPlatform(platform)
+        VerifyPlatform(platform)
 
         data: dict = (await self.http.SearchPlayer(platform.value, username))["data"]
 
@@ -557,25 +752,83 @@ class Client:
         results: List[Player] = []
 
         for player in data:
-            accountId: Optional[int] = player.get("accountId")
-            if accountId is not None:
-                # The API returns the accountId as a string
-                accountId: Optional[int] = int(player.get("accountId"))
+            results.append(self._CreateSearchResult(player))
 
-            avatar: Union[dict, str] = player.get("avatar")
-            if isinstance(avatar, dict):
-                avatar: Union[dict, str] = avatar["avatarUrlLargeSsl"]
+        return results
 
-            data = {
-                "platform": player["platform"],
-                "username": player["username"],
-                "accountId": accountId,
-                "avatarUrl": avatar,
-            }
+    def _CreateSearchResult(self, data: dict) -> Player:
+        """Create a Player object from a player search result."""
 
-            results.append(Player(self, data))
+        accountId: Optional[int] = data.get("accountId")
+        if accountId is not None:
+            # The API returns the accountId as a string
+            accountId: Optional[int] = int(data.get("accountId"))
 
-        return results
+        avatar: Union[dict, str] = data.get("avatar")
+        if isinstance(avatar, dict):
+            avatar: Union[dict, str] = avatar["avatarUrlLargeSsl"]
+
+        return self._Record(
+            Player(
+                self,
+                {
+                    "platform": data["platform"],
+                    "username": data["username"],
+                    "accountId": accountId,
+                    "avatarUrl": avatar,
+                },
+            )
+        )
+
+    async def ResolveAccountId(
+        self, platform: Platform, username: str
+    ) -> Optional[int]:
+        """
+        Resolve a Call of Duty player's Account ID using the identities
+        seen in previous responses, searching for the player if unknown.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+
+        Returns
+        -------
+        int
+            Account ID of the player, None if the player wasn't found.
+        """
+
+        if self.identities is not None:
+            player: Optional[Player] = self.identities.Lookup(platform, username)
+
+            if (player is not None) and (player.accountId is not None):
+                return int(player.accountId)
+
+        for player in await self.SearchPlayers(platform, username):
+            if (player.username.lower() == username.lower()) and (
+                player.accountId is not None
+            ):
+                return int(player.accountId)
+
+        return None
+
+    def _Record(
+        self, players: Union[Player, List[Player]]
+    ) -> Union[Player, List[Player]]:
+        """
+        Record the identities of players in the identity index, returning
+        the recorded Player objects which replace them when interning.
+        """
+
+        if self.identities is None:
+            return players
+
+        if isinstance(players, Player):
+            return self.identities.Record(players)
+
+        return self.identities.RecordMany(players)
 
     async def GetPlayerProfile(
         self, platform: Platform, username: str, title: Title, mode: Mode
@@ -598,18 +851,140 @@ class Client:
         -------
         dict
             JSON data of the player's complete profile for the requested
-            title and mode.
+            title and mode. When profileTTL is set, the returned object is
+            cached and shared between calls, so it should not be modified.
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
-        #VerifyMode(mode, title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
 
-        return (
-            await self.http.GetPlayerProfile(
-                platform.value, username, title.value, mode.value
-            )
-        )["data"]
+        async def fetch() -> dict:
+            return (
+                await self.http.GetPlayerProfile(
+                    platform.value, username, title.value, mode.value
+                )
+            )["data"]
+
+        return await self.profileCache.Get(
+            (platform, username.lower(), title, mode), fetch
+        )
+
+    async def GetPlayerProfiles(
+        self,
+        players: Iterable[Union[Player, Tuple[Platform, str]]],
+        title: Title,
+        mode: Mode,
+        **kwargs,
+    ) -> AsyncIterator[ProfileResult]:
+        """
+        Get the profiles of many Call of Duty players for the specified
+        title and mode, yielding each result as it completes.
+
+        Parameters
+        ----------
+        players : iterable
+            Player objects or (platform, username) tuples of the players.
+            Duplicate players are only requested once.
+        title : callofduty.Title
+            Call of Duty title to get the players' profiles from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the players' profiles from.
+        concurrency : int, optional
+            Maximum number of profiles which are requested at once (default is 10.)
+        retries : int, optional
+            Number of times a rate limited request is retried (default is 3.)
+        retryDelay : float, optional
+            Number of seconds to wait before the first retry, doubling
+            with each subsequent retry (default is 1.)
+
+        Yields
+        ------
+        callofduty.ProfileResult
+            Outcome of the request for each player's profile. Failed requests
+            are reported as results rather than raised.
+        """
+
+        concurrency: int = kwargs.get("concurrency", 10)
+
+        pending: Iterator[Union[Player, Tuple[Platform, str]]] = iter(players)
+        seen: Set[Tuple[Platform, str]] = set()
+
+        # Bounding the queue applies backpressure to the workers when the
+        # results aren't consumed as quickly as they're requested.
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+        def take() -> Optional[Tuple[Platform, str]]:
+            for player in pending:
+                if isinstance(player, Player):
+                    key: Tuple[Platform, str] = (player.platform, player.username)
+                else:
+                    key: Tuple[Platform, str] = (player[0], player[1])
+
+                if key not in seen:
+                    seen.add(key)
+
+                    return key
+
+            return None
+
+        async def work():
+            while (key := take()) is not None:
+                await results.put(
+                    await self._GetPlayerProfileResult(
+                        key[0], key[1], title, mode, **kwargs
+                    )
+                )
+
+            await results.put(None)
+
+        workers: List[asyncio.Task] = [
+            asyncio.ensure_future(work()) for _ in range(max(1, concurrency))
+        ]
+        remaining: int = len(workers)
+
+        try:
+            while remaining > 0:
+                result: Optional[ProfileResult] = await results.get()
+
+                if result is None:
+                    remaining -= 1
+                else:
+                    yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _GetPlayerProfileResult(
+        self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
+    ) -> ProfileResult:
+        """Get a player's profile, capturing the outcome as a ProfileResult."""
+
+        retries: int = kwargs.get("retries", 3)
+        retryDelay: float = kwargs.get("retryDelay", 1)
+
+        attempt: int = 0
+
+        while True:
+            try:
+                profile: dict = await self.GetPlayerProfile(
+                    platform, username, title, mode
+                )
+            except HTTPException as e:
+                # HTTP 429: Too Many Requests
+                if (e.statusCode == 429) and (attempt < retries):
+                    await asyncio.sleep(retryDelay * (2 ** attempt))
+                    attempt += 1
+
+                    continue
+
+                outcome: Outcome = ClassifyError(e) or Outcome.Error
+
+                return ProfileResult(platform, username, outcome, error=e)
+            except Exception as e:
+                return ProfileResult(platform, username, Outcome.Error, error=e)
+
+            return ProfileResult(platform, username, Outcome.Success, profile=profile)
 
     async def GetMatch(self, title: Title, platform: Platform, matchId: int) -> Match:
         """
@@ -630,8 +1005,8 @@ class Client:
             Match object representing the specified details.
         """
 
-        #VerifyTitle(title)
-        #VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyPlatform(platform)
 
         return Match(
             self, {"id": matchId, "platform": platform.value, "title": title.value,},
@@ -665,21 +1040,212 @@ class Client:
         Returns
         -------
         list
-            Array of Match objects.
+            Array of Match objects, each carrying its match history entry
+            as Match.data.
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
-        #VerifyMode(mode, title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
 
         limit: int = kwargs.get("limit", 10)
         startTimestamp: int = kwargs.get("startTimestamp", 0)
         endTimestamp: int = kwargs.get("endTimestamp", 0)
 
+        data: List[dict] = await self._GetPlayerMatchesData(
+            platform, username, title, mode, limit, startTimestamp, endTimestamp
+        )
+
+        matches: List[Match] = []
+        for _match in data:
+            matches.append(self._CreateMatch(platform, title, _match))
+
+        return matches
+
+    async def IterPlayerMatches(
+        self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
+    ) -> AsyncIterator[Match]:
+        """
+        Iterate over a Call of Duty player's complete match history for the
+        specified title and mode, paging backwards through time.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+        title : callofduty.Title
+            Call of Duty title to get the player's matches from.
+        mode: callofduty.Mode
+            Call of Duty mode to get the player's matches from.
+        limit : int, optional
+            Number of matches which will be requested per page (default is 20.)
+        startTimestamp : int, optional
+            Unix timestamp (in milliseconds) representing the earliest time
+            which a returned match should've occured (default is None.)
+        endTimestamp : int, optional
+            Unix timestamp (in milliseconds) representing the latest time
+            which a returned match should've occured (default is now.)
+        windows : int, optional
+            Number of time windows to split the range between startTimestamp
+            and endTimestamp into and crawl concurrently. Requires
+            startTimestamp; matches are then no longer yielded strictly
+            newest first (default is 1.)
+
+        Yields
+        ------
+        callofduty.Match
+            Match object for each unique match in the player's history.
+        """
+
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
+
+        limit: int = kwargs.get("limit", 20)
+        startTimestamp: int = kwargs.get("startTimestamp", 0)
+        endTimestamp: int = kwargs.get("endTimestamp", 0)
+        windows: int = kwargs.get("windows", 1)
+
+        # Matches which share a page boundary timestamp are returned twice,
+        # track every match ID so that each is only yielded once.
+        seen: Set[str] = set()
+
+        if (windows <= 1) or (startTimestamp <= 0):
+            if windows > 1:
+                log.warning("IterPlayerMatches requires startTimestamp for windows")
+
+            async for _match in self._WalkPlayerMatches(
+                platform,
+                username,
+                title,
+                mode,
+                limit,
+                startTimestamp,
+                endTimestamp,
+                seen,
+            ):
+                yield self._CreateMatch(platform, title, _match)
+
+            return
+
+        if endTimestamp <= 0:
+            endTimestamp: int = int(time.time() * 1000)
+
+        step: int = max(1, (endTimestamp - startTimestamp) // windows)
+        edges: List[int] = [startTimestamp + (step * i) for i in range(windows)]
+        edges.append(endTimestamp)
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def crawl(start: int, end: int):
+            try:
+                async for _match in self._WalkPlayerMatches(
+                    platform, username, title, mode, limit, start, end, seen
+                ):
+                    await queue.put(_match)
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await queue.put(None)
+
+        tasks: List[asyncio.Task] = [
+            asyncio.ensure_future(crawl(edges[i], edges[i + 1]))
+            for i in range(len(edges) - 1)
+            if edges[i + 1] > edges[i]
+        ]
+        remaining: int = len(tasks)
+
+        try:
+            while remaining > 0:
+                item: Union[dict, Exception, None] = await queue.get()
+
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield self._CreateMatch(platform, title, item)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _WalkPlayerMatches(
+        self,
+        platform: Platform,
+        username: str,
+        title: Title,
+        mode: Mode,
+        limit: int,
+        startTimestamp: int,
+        endTimestamp: int,
+        seen: Set[str],
+    ) -> AsyncIterator[dict]:
+        """
+        Page backwards through a player's match history between the
+        specified timestamps, using the oldest match of each page as the
+        endTimestamp of the next.
+        """
+
+        while True:
+            data: List[dict] = await self._GetPlayerMatchesData(
+                platform, username, title, mode, limit, startTimestamp, endTimestamp
+            )
+
+            oldest: Optional[int] = None
+            new: int = 0
+
+            for _match in data:
+                timestamp: Optional[int] = self._MatchTimestamp(_match)
+
+                if timestamp is not None:
+                    if (startTimestamp > 0) and (timestamp < startTimestamp):
+                        continue
+
+                    oldest = timestamp if oldest is None else min(oldest, timestamp)
+
+                matchId: str = str(_match.get("matchId", _match.get("matchID")))
+                if matchId in seen:
+                    continue
+
+                seen.add(matchId)
+                new += 1
+
+                yield _match
+
+            # The endpoint may return fewer matches than the limit before the
+            # last page, so only a page without new matches ends the walk.
+            if (new == 0) or (oldest is None):
+                return
+
+            # Stepping back at least one millisecond per page guarantees that
+            # the walk makes progress.
+            end: int = oldest
+            if (endTimestamp > 0) and (end >= endTimestamp):
+                end = endTimestamp - 1
+
+            if end <= startTimestamp:
+                return
+
+            endTimestamp = end
+
+    async def _GetPlayerMatchesData(
+        self,
+        platform: Platform,
+        username: str,
+        title: Title,
+        mode: Mode,
+        limit: int,
+        startTimestamp: int,
+        endTimestamp: int,
+    ) -> List[dict]:
+        """Get a single page of a player's match history as JSON data."""
+
         if platform == Platform.Activision:
             # The preferred matches endpoint does not currently support
             # the Activision (uno) platform.
-            data: dict = (
+            return (
                 await self.http.GetPlayerMatchesDetailed(
                     platform.value,
                     username,
@@ -691,49 +1257,48 @@ class Client:
                 )
             )["data"]["matches"]
 
-            matches: List[Match] = []
+        return (
+            await self.http.GetPlayerMatches(
+                platform.value,
+                username,
+                title.value,
+                mode.value,
+                limit,
+                startTimestamp,
+                endTimestamp,
+            )
+        )["data"]
 
-            for _match in data:
-                matches.append(
-                    Match(
-                        self,
-                        {
-                            # The API returns the matchId as a string
-                            "id": int(_match["matchID"]),
-                            "platform": platform.value,
-                            "title": title.value,
-                        },
-                    )
-                )
-        else:
-            data: dict = (
-                await self.http.GetPlayerMatches(
-                    platform.value,
-                    username,
-                    title.value,
-                    mode.value,
-                    limit,
-                    startTimestamp,
-                    endTimestamp,
-                )
-            )["data"]
+    def _CreateMatch(self, platform: Platform, title: Title, data: dict) -> Match:
+        """Create a Match object from a match history entry."""
 
-            matches: List[Match] = []
+        # The detailed matches endpoint names the key matchID rather than
+        # matchId. In both cases, the API returns the matchId as a string.
+        matchId: str = data["matchId"] if "matchId" in data else data["matchID"]
 
-            for _match in data:
-                matches.append(
-                    Match(
-                        self,
-                        {
-                            # The API returns the matchId as a string
-                            "id": int(_match["matchId"]),
-                            "platform": platform.value,
-                            "title": title.value,
-                        },
-                    )
-                )
+        # Keep the match history entry on the Match so that callers don't
+        # need another request for data they've already received.
+        return Match(
+            self,
+            {
+                "id": int(matchId),
+                "platform": platform.value,
+                "title": title.value,
+                "data": data,
+            },
+        )
 
-        return matches
+    @staticmethod
+    def _MatchTimestamp(data: dict) -> Optional[int]:
+        """Get the start time of a match history entry in milliseconds."""
+
+        if (timestamp := data.get("timestamp")) is not None:
+            return int(timestamp)
+
+        if (seconds := data.get("utcStartSeconds")) is not None:
+            return int(seconds) * 1000
+
+        return None
 
     async def GetPlayerMatchesSummary(
         self, platform: Platform, username: str, title: Title, mode: Mode, **kwargs
@@ -766,9 +1331,9 @@ class Client:
             JSON data containing recent matches summary.
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
-        #VerifyMode(mode, title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
 
         limit: int = kwargs.get("limit", 10)
         startTimestamp: int = kwargs.get("startTimestamp", 0)
@@ -817,9 +1382,9 @@ class Client:
             Array of Match objects.
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
-        #VerifyMode(mode, title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
 
         limit: int = kwargs.get("limit", 10)
         startTimestamp: int = kwargs.get("startTimestamp", 0)
@@ -860,8 +1425,8 @@ class Client:
             JSON data containing the full details of the requested Call of Duty match.
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         return (await self.http.GetMatch(title.value, platform.value, matchId))["data"]
 
@@ -888,18 +1453,23 @@ class Client:
             players on the team.
         """
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         data: dict = (await self.http.GetMatch(title.value, platform.value, matchId))[
             "data"
-        ]["teams"]
+        ]
+
+        return self._CreateMatchTeams(data)
+
+    def _CreateMatchTeams(self, data: dict) -> List[List[Player]]:
+        """Create the team arrays of Player objects from match details."""
 
         # The API does not state which team is allies/axis, so no array
         # keys will be used.
         teams: list = []
 
-        for team in data:
+        for team in data["teams"]:
             # Current team iterator
             i: List[Player] = []
 
@@ -915,7 +1485,7 @@ class Client:
                     )
                 )
 
-            teams.append(i)
+            teams.append(self._Record(i))
 
         return teams
 
@@ -951,25 +1521,30 @@ class Client:
         timeFrame: TimeFrame = kwargs.get("timeFrame", TimeFrame.AllTime)
         page: int = kwargs.get("page", 1)
 
-        #VerifyTitle(title)
-        #VerifyPlatform(platform)
-        #VerifyGameType(gameType)
-        #VerifyTimeFrame(timeFrame)
+        VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyGameType(gameType)
+        VerifyTimeFrame(timeFrame)
 
-        data: dict = (
-            await self.http.GetLeaderboard(
-                title.value,
-                platform.value,
-                gameType.value,
-                gameMode,
-                timeFrame.value,
-                page,
-            )
-        )["data"]
+        async def fetch() -> dict:
+            data: dict = (
+                await self.http.GetLeaderboard(
+                    title.value,
+                    platform.value,
+                    gameType.value,
+                    gameMode,
+                    timeFrame.value,
+                    page,
+                )
+            )["data"]
 
-        # Leaderboard responses don't include the timeFrame, so we'll
-        # just add it manually.
-        data["timeFrame"] = timeFrame.value
+            # Leaderboard responses don't include the timeFrame, so we'll
+            # just add it manually.
+            return {**data, "timeFrame": timeFrame.value}
+
+        data: dict = await self.leaderboardCache.Get(
+            (title, platform, gameType, gameMode, timeFrame, page), fetch
+        )
 
         return Leaderboard(self, data)
 
@@ -1004,10 +1579,10 @@ class Client:
         gameMode: str = kwargs.get("gameMode", "career")
         timeFrame: TimeFrame = kwargs.get("timeFrame", TimeFrame.AllTime)
 
-        #VerifyTitle(title)
-        #VerifyPlatform(platform)
-        #VerifyGameType(gameType)
-        #VerifyTimeFrame(timeFrame)
+        VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyGameType(gameType)
+        VerifyTimeFrame(timeFrame)
 
         data: dict = (
             await self.http.GetPlayerLeaderboard(
@@ -1022,9 +1597,7 @@ class Client:
 
         # Leaderboard responses don't include the timeFrame, so we'll
         # just add it manually.
-        data["timeFrame"] = timeFrame.value
-
-        return Leaderboard(self, data)
+        return Leaderboard(self, {**data, "timeFrame": timeFrame.value})
 
     async def GetLeaderboardPlayers(
         self, title: Title, platform: Platform, **kwargs
@@ -1058,10 +1631,10 @@ class Client:
         timeFrame: TimeFrame = kwargs.get("timeFrame", TimeFrame.AllTime)
         page: int = kwargs.get("page", 1)
 
-        #VerifyTitle(title)
-        #VerifyPlatform(platform)
-        #VerifyGameType(gameType)
-        #VerifyTimeFrame(timeFrame)
+        VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyGameType(gameType)
+        VerifyTimeFrame(timeFrame)
 
         data: dict = (
             await self.http.GetLeaderboard(
@@ -1076,15 +1649,17 @@ class Client:
 
         # Leaderboard responses don't include the timeFrame, so we'll
         # just add it manually.
-        data["timeFrame"] = timeFrame.value
+        leaderboard: Leaderboard = Leaderboard(
+            self, {**data, "timeFrame": timeFrame.value}
+        )
 
         players: List[Player] = []
-        for entry in Leaderboard(self, data).entries:
+        for entry in leaderboard.entries:
             players.append(
                 Player(self, {"platform": platform.value, "username": entry.username})
             )
 
-        return players
+        return self._Record(players)
 
     async def GetAvailableMaps(
         self,
@@ -1108,11 +1683,18 @@ class Client:
         -------
         list
             Array of Maps and the Game Modes which are available each map.
+            The returned object is cached and shared between calls, so it
+            should not be modified.
         """
 
-        return (
-            await self.http.GetAvailableMaps(title.value, platform.value, mode.value)
-        )["data"]
+        async def fetch() -> list:
+            return (
+                await self.http.GetAvailableMaps(
+                    title.value, platform.value, mode.value
+                )
+            )["data"]
+
+        return await self.mapsCache.Get((title, platform, mode), fetch)
 
     async def GetLootSeason(self, title: Title, season: int, **kwargs) -> Season:
         """
@@ -1138,8 +1720,8 @@ class Client:
         platform = kwargs.get("platform", Platform.PlayStation)
         language = kwargs.get("language", Language.English)
 
-        #VerifyPlatform(platform)
-        #VerifyLanguage(language)
+        VerifyPlatform(platform)
+        VerifyLanguage(language)
 
         data: dict = (
             await self.http.GetLootSeason(
@@ -1149,12 +1731,16 @@ class Client:
 
         # Loot Season responses don't include these values, so we'll just
         # add them manually.
-        data["title"] = title.value
-        data["platform"] = platform.value
-        data["season"] = season
-        data["language"] = language.value
-
-        return Season(self, data)
+        return Season(
+            self,
+            {
+                **data,
+                "title": title.value,
+                "platform": platform.value,
+                "season": season,
+                "language": language.value,
+            },
+        )
 
     async def GetPlayerLoadouts(
         self, platform: Platform, username: str, title: Title, **kwargs
@@ -1179,23 +1765,9 @@ class Client:
             Array of loadout objects.
         """
 
-        mode: Mode = kwargs.get("mode", Mode.Multiplayer)
-
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
-        #VerifyMode(mode, title)
-
-        data: dict = (
-            await self.http.GetPlayerLoadouts(
-                platform.value, username, title.value, mode.value
-            )
-        )["data"]
-
-        loadouts: List[Loadout] = []
-        for _loadout in data["loadouts"]:
-            loadouts.append(Loadout(self, _loadout))
-
-        return loadouts
+        return (
+            await self.GetPlayerLoadoutsAndUnlocks(platform, username, title, **kwargs)
+        )["loadouts"]
 
     async def GetPlayerLoadoutUnlocks(
         self, platform: Platform, username: str, title: Title, **kwargs
@@ -1220,11 +1792,40 @@ class Client:
             Array of loadout item objects.
         """
 
+        return (
+            await self.GetPlayerLoadoutsAndUnlocks(platform, username, title, **kwargs)
+        )["unlocks"]
+
+    async def GetPlayerLoadoutsAndUnlocks(
+        self, platform: Platform, username: str, title: Title, **kwargs
+    ) -> dict:
+        """
+        Get a Call of Duty player's loadouts and available loadout unlocks
+        for the specified title and mode using a single request.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the player from.
+        username : str
+            Player's username for the designated platform.
+        title : callofduty.Title
+            Call of Duty title to get the player's loadouts from.
+        mode: callofduty.Mode, optional
+            Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+
+        Returns
+        -------
+        dict
+            JSON data containing an array of loadout objects and an array
+            of loadout item objects for the available unlocks.
+        """
+
         mode: Mode = kwargs.get("mode", Mode.Multiplayer)
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
-        #VerifyMode(mode, title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
+        VerifyMode(mode, title)
 
         data: dict = (
             await self.http.GetPlayerLoadouts(
@@ -1232,11 +1833,15 @@ class Client:
             )
         )["data"]
 
+        loadouts: List[Loadout] = []
+        for _loadout in data["loadouts"]:
+            loadouts.append(Loadout(self, _loadout))
+
         unlocks: List[LoadoutItem] = []
         for unlock in data["availableUnlocks"]:
             unlocks.append(LoadoutItem(self, {"id": unlock}))
 
-        return unlocks
+        return {"loadouts": loadouts, "unlocks": unlocks}
 
     async def GetAuthenticityStamp(
         self, platform: Platform, username: str, phrase: str, **kwargs
@@ -1263,8 +1868,8 @@ class Client:
 
         title: Title = kwargs.get("title", Title.BlackOps4)
 
-        #VerifyPlatform(platform)
-        #VerifyTitle(title)
+        VerifyPlatform(platform)
+        VerifyTitle(title)
 
         data: dict = (
             await self.http.GetAuthenticityStamp(
@@ -1274,12 +1879,16 @@ class Client:
 
         # Authenticity Stamp responses don't include the platform,
         # title, username, or mode, so we'll just add them manually.
-        data["platform"] = platform.value
-        data["username"] = username
-        data["title"] = title.value
-        data["mode"] = Mode.Zombies.value
-
-        return AuthenticityStamp(self, data)
+        return AuthenticityStamp(
+            self,
+            {
+                **data,
+                "platform": platform.value,
+                "username": username,
+                "title": title.value,
+                "mode": Mode.Zombies.value,
+            },
+        )
 
     async def AddFriend(self, accountId: int) -> str:
         """
@@ -1428,7 +2037,7 @@ class Client:
             Squad object for the requested Squad.
         """
 
-        return Squad(self, (await self.http.GetSquad(name))["data"])
+        return self._CreateSquad((await self.http.GetSquad(name))["data"])
 
     async def GetPlayerSquad(self, platform: Platform, username: str) -> Squad:
         """
@@ -1447,10 +2056,10 @@ class Client:
             Squad object for the requested Squad.
         """
 
-        #VerifyPlatform(platform)
+        VerifyPlatform(platform)
 
-        return Squad(
-            self, (await self.http.GetPlayerSquad(platform.value, username))["data"]
+        return self._CreateSquad(
+            (await self.http.GetPlayerSquad(platform.value, username))["data"]
         )
 
     async def GetMySquad(self) -> Squad:
@@ -1463,7 +2072,19 @@ class Client:
             Squad object for the requested Squad.
         """
 
-        return Squad(self, (await self.http.GetMySquad())["data"])
+        return self._CreateSquad((await self.http.GetMySquad())["data"])
+
+    def _CreateSquad(self, data: dict) -> Squad:
+        """Create a Squad object, recording the identities of its members."""
+
+        squad: Squad = Squad(self, data)
+
+        players: List[Player] = self._Record([squad.owner] + squad.members)
+
+        squad.owner = players[0]
+        squad.members = players[1:]
+
+        return squad
 
     async def JoinSquad(self, name: str):
         """
@@ -50,3 +50,16 @@ class Reaction(Enum):
     Shocked = "shock"
     FistBump = "congrats"
     Remove = "none"
+
+
+class Outcome(Enum):
+    Success = "success"
+    NotFound = "notFound"
+    Forbidden = "forbidden"
+    Error = "error"
+
+
+class SquadChange(Enum):
+    Join = "join"
+    Leave = "leave"
+    Points = "points"
@@ -85,6 +85,15 @@ class InvalidReaction(ClientException):
     pass
 
 
+class CacheMiss(ClientException):
+    """
+    Exception which is thrown when an offline client performs a request
+    which was not captured.
+    """
+
+    pass
+
+
 class HTTPException(CallofDutyException):
     """
     Exception which is thrown when an HTTP request operation fails.
@@ -98,6 +107,9 @@ class HTTPException(CallofDutyException):
     """
 
     def __init__(self, statusCode: int, res: Union[dict, str]):
+        self.statusCode: int = statusCode
+        self.res: Union[dict, str] = res
+
         if isinstance(res, dict):
             try:
                 message: Union[dict, str] = res["data"].get("message", res)
@@ -1,12 +1,12 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from .enums import Reaction, Title
 from .match import Match
-from .object import Object
+from .object import Hydrator, Object
 from .player import Player
-from .utils import StripHTML
+from .utils import Convert, StripHTML, StripHTMLMany
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -36,26 +36,50 @@ class FeedItem(Object):
     """
 
     _type: str = "FeedItem"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.player: Player = Player(
-            self, {"platform": data.pop("platform"), "username": data.pop("username")}
-        )
-        self.title: Title = Title(data.pop("title"))
-        self.match: Optional[Match] = None
-        self.category: str = data.pop("category")
-        self.date: datetime = datetime.fromtimestamp((data.pop("date") / 1000))
-        self.html: str = data.pop("rendered")
-        self.text: str = StripHTML(self.html)
-        self.favorited: bool = data.pop("favorited")
-
-        if (_matchId := data["meta"].get("matchId")) is not None:
-            self.match: Optional[Match] = Match(
-                client,
-                {"id": _matchId, "platform": self.player.platform, "title": self.title},
+    _fields: Dict[str, Hydrator] = {
+        "player": lambda self, data: self._Record(
+            Player(
+                self._client,
+                {"platform": data["platform"], "username": data["username"]},
             )
+        ),
+        "title": lambda self, data: Convert(Title, data["title"]),
+        "match": lambda self, data: self._CreateMatch(data),
+        "category": lambda self, data: data["category"],
+        "date": lambda self, data: datetime.fromtimestamp((data["date"] / 1000)),
+        "html": lambda self, data: data["rendered"],
+        "text": lambda self, data: StripHTML(self.html),
+        "favorited": lambda self, data: data["favorited"],
+    }
+    _deferred: Tuple[str, ...] = ("text",)
+    __slots__ = (
+        "player",
+        "title",
+        "match",
+        "category",
+        "date",
+        "html",
+        "text",
+        "favorited",
+    )
+
+    player: Player
+    title: Title
+    match: Optional[Match]
+    category: str
+    date: datetime
+    html: str
+    text: str
+    favorited: bool
+
+    def _CreateMatch(self, data: dict) -> Optional[Match]:
+        if (_matchId := data["meta"].get("matchId")) is None:
+            return None
+
+        return Match(
+            self._client,
+            {"id": _matchId, "platform": data["platform"], "title": data["title"]},
+        )
 
     async def react(self, reaction: Reaction) -> None:
         """
@@ -159,28 +183,48 @@ class Blog(Object):
     """
 
     _type: str = "Blog"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.author: Optional[str] = data.pop("author", None)
-        self.title: str = data.pop("title")
-        self.subtitle: Optional[str] = data.pop("subTitle", None)
-        self.html: Optional[str] = data.pop("html", None)
-        self.text: Optional[str] = StripHTML(
-            self.html
-        ) if self.html is not None else None
-        self.url: str = data.pop("url")
-        self.thumbnail: str = data.pop("dimg")
-        self.category: str = data["metadata"].pop("contentItemType")
-        self.published: datetime = datetime(
-            data["publishedDate"].pop("year"),
-            data["publishedDate"].pop("month"),
-            data["publishedDate"].pop("dayOfMonth"),
-            data["publishedDate"].pop("hourOfDay"),
-            data["publishedDate"].pop("minute"),
-            data["publishedDate"].pop("second"),
-        )
+    _fields: Dict[str, Hydrator] = {
+        "author": lambda self, data: data.get("author"),
+        "title": lambda self, data: data["title"],
+        "subtitle": lambda self, data: data.get("subTitle"),
+        "html": lambda self, data: data.get("html"),
+        "text": lambda self, data: (
+            StripHTML(self.html) if self.html is not None else None
+        ),
+        "url": lambda self, data: data["url"],
+        "thumbnail": lambda self, data: data["dimg"],
+        "category": lambda self, data: data["metadata"]["contentItemType"],
+        "published": lambda self, data: datetime(
+            data["publishedDate"]["year"],
+            data["publishedDate"]["month"],
+            data["publishedDate"]["dayOfMonth"],
+            data["publishedDate"]["hourOfDay"],
+            data["publishedDate"]["minute"],
+            data["publishedDate"]["second"],
+        ),
+    }
+    _deferred: Tuple[str, ...] = ("text",)
+    __slots__ = (
+        "author",
+        "title",
+        "subtitle",
+        "html",
+        "text",
+        "url",
+        "thumbnail",
+        "category",
+        "published",
+    )
+
+    author: Optional[str]
+    title: str
+    subtitle: Optional[str]
+    html: Optional[str]
+    text: Optional[str]
+    url: str
+    thumbnail: str
+    category: str
+    published: datetime
 
 
 class Video(Object):
@@ -204,13 +248,38 @@ class Video(Object):
     """
 
     _type: str = "Video"
+    _fields: Dict[str, Hydrator] = {
+        "title": lambda self, data: data["title"],
+        "description": lambda self, data: data["description"],
+        "url": lambda self, data: "https://youtu.be/" + data["youtubeId"],
+        "length": lambda self, data: data["length"],
+        "thumbnail": lambda self, data: data["image"],
+        "categories": lambda self, data: data["categories"],
+    }
+    __slots__ = ("title", "description", "url", "length", "thumbnail", "categories")
+
+    title: str
+    description: str
+    url: str
+    length: str
+    thumbnail: str
+    categories: List[str]
+
+
+def StripFeed(items: Iterable[Union[FeedItem, Blog]]):
+    """
+    Materialize the text of multiple feed items or blog posts at once, which
+    is faster than materializing the text of each upon first access.
+
+    Parameters
+    ----------
+    items : iterable
+        FeedItem or Blog objects to materialize the text of.
+    """
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+    pending: List[Union[FeedItem, Blog]] = [
+        item for item in items if (item._raw is not None) and (item.html is not None)
+    ]
 
-        self.title: str = data.pop("title")
-        self.description: str = data.pop("description")
-        self.url: str = "https://youtu.be/" + data.pop("youtubeId")
-        self.length: str = data.pop("length")
-        self.thumbnail: str = data.pop("image")
-        self.categories: List[str] = data.pop("categories")
+    for item, text in zip(pending, StripHTMLMany([item.html for item in pending])):
+        item.text = text
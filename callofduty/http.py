@@ -1,10 +1,13 @@
+import asyncio
 import logging
 import urllib.parse
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 from httpx import AsyncClient, Response
 
-from .errors import Forbidden, HTTPException, NotFound
+from .cache import NegativeCache
+from .capture import Capture
+from .errors import ClientException, Forbidden, HTTPException, NotFound
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -46,6 +49,8 @@ class Request:
         Headers to include in the request (default is None.)
     json : dict, optional
         JSON data to include in the body of the request (default is None.)
+    route : str, optional
+        Name of the HTTP method which created the request (default is None.)
     """
 
     defaultBaseUrl: str = "https://callofduty.com/"
@@ -59,6 +64,7 @@ class Request:
         self.method: str = method
         self.headers: Dict[str, str] = {}
         self.json: dict = kwargs.get("json", {})
+        self.route: Optional[str] = kwargs.get("route")
 
         if endpoint is not None:
             baseUrl: str = kwargs.get("baseUrl", self.defaultBaseUrl)
@@ -73,11 +79,112 @@ class Request:
 
 
 class HTTP:
-    """HTTP client used to communicate with the Call of Duty API."""
+    """
+    HTTP client used to communicate with the Call of Duty API.
 
-    def __init__(self, auth):
+    Parameters
+    ----------
+    auth : callofduty.Auth
+        Authorization flow which provides the session and credentials, None
+        if offline.
+    maxConcurrency : int, optional
+        Maximum number of requests which may be in flight at once (default
+        is None, unlimited.)
+    negativeCache : bool/callofduty.NegativeCache, optional
+        Cache of failed requests, True to use the default NegativeCache or
+        False to disable (default is True.)
+    capture : str/callofduty.Capture, optional
+        Path of the file, or Capture, to record responses to (default is
+        None.)
+    offline : bool, optional
+        Boolean indicating whether or not requests are served only from the
+        capture, without network access or authentication (default is
+        False.)
+    conditional : bool, optional
+        Boolean indicating whether or not the static content routes are
+        revalidated with conditional requests, reusing the previous
+        response when it is unmodified (default is True.)
+    """
+
+    conditionalRoutes: Tuple[str, ...] = (
+        "GetAppLocalize",
+        "GetWebLocalize",
+        "GetNewsFeed",
+        "GetVideoFeed",
+    )
+
+    def __init__(self, auth, **kwargs):
         self.auth = auth
-        self.session: AsyncClient = auth.session
+        self.session: Optional[AsyncClient] = None if auth is None else auth.session
+
+        self.maxConcurrency: Optional[int] = kwargs.get("maxConcurrency")
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+        if self.maxConcurrency is not None:
+            self.semaphore = asyncio.Semaphore(self.maxConcurrency)
+
+        negativeCache: Union[bool, NegativeCache] = kwargs.get("negativeCache", True)
+
+        if negativeCache is True:
+            self.negativeCache: Optional[NegativeCache] = NegativeCache()
+        elif negativeCache is False:
+            self.negativeCache: Optional[NegativeCache] = None
+        else:
+            self.negativeCache: Optional[NegativeCache] = negativeCache
+
+        capture: Optional[Union[str, Capture]] = kwargs.get("capture")
+
+        if isinstance(capture, str):
+            self.capture: Optional[Capture] = Capture(capture)
+        else:
+            self.capture: Optional[Capture] = capture
+
+        self.offline: bool = kwargs.get("offline", False)
+
+        if (self.offline is True) and (self.capture is None):
+            raise ClientException("Offline mode requires a capture")
+
+        self.conditional: bool = kwargs.get("conditional", True)
+
+        # Validators and data of the latest response of each URL, which are
+        # used to revalidate the static content routes.
+        self._validators: Dict[
+            str, Tuple[Optional[str], Optional[str], Union[dict, str]]
+        ] = {}
+
+    async def WarmUp(self):
+        """
+        Open connections to each of the Request base URLs in parallel, so
+        that subsequent requests reuse them rather than paying for DNS,
+        TCP and TLS setup.
+        """
+
+        if self.offline is True:
+            return
+
+        baseUrls: Tuple[str, ...] = (
+            Request.defaultBaseUrl,
+            Request.myBaseUrl,
+            Request.squadsBaseUrl,
+        )
+
+        results: list = await asyncio.gather(
+            *[
+                self.session.request("HEAD", baseUrl, allow_redirects=False)
+                for baseUrl in baseUrls
+            ],
+            return_exceptions=True,
+        )
+
+        for baseUrl, result in zip(baseUrls, results):
+            if isinstance(result, Exception):
+                log.warning(f"Failed to open connection to {baseUrl}, {result}")
+
+    async def Close(self):
+        """Close the session, along with its open connections."""
+
+        if self.session is not None:
+            await self.session.aclose()
 
     async def Send(self, req: Request) -> Union[dict, str]:
         """
@@ -94,50 +201,129 @@ class HTTP:
             Response of the HTTP request.
         """
 
+        if self.negativeCache is None:
+            return await self._SendLimited(req)
+
+        if (error := self.negativeCache.Get(req)) is not None:
+            raise error
+
+        try:
+            return await self._SendLimited(req)
+        except HTTPException as e:
+            self.negativeCache.Put(req, e)
+
+            raise
+
+    async def _SendLimited(self, req: Request) -> Union[dict, str]:
+        if self.semaphore is not None:
+            async with self.semaphore:
+                return await self._Send(req)
+
+        return await self._Send(req)
+
+    async def _Send(self, req: Request) -> Union[dict, str]:
+        if self.offline is True:
+            return self._Handle(*self.capture.Replay(req))
+
         req.SetHeader("Authorization", f"Bearer {self.auth.AccessToken}")
         req.SetHeader("x_cod_device_id", self.auth.DeviceId)
 
-        async with self.session as client:
-            res: Response = await client.request(
-                req.method, req.url, headers=req.headers, json=req.json
-            )
+        conditional: bool = (
+            (self.conditional is True)
+            and (req.method == "GET")
+            and (req.route in self.conditionalRoutes)
+        )
+        cached: Optional[Tuple[Optional[str], Optional[str], Union[dict, str]]] = (
+            self._validators.get(req.url) if conditional else None
+        )
+
+        if cached is not None:
+            etag, lastModified, _ = cached
 
+            if etag is not None:
+                req.SetHeader("If-None-Match", etag)
+            if lastModified is not None:
+                req.SetHeader("If-Modified-Since", lastModified)
+
+        # The session is used directly, rather than as a context manager,
+        # as exiting it closes the connections which would otherwise be
+        # kept alive for subsequent requests.
+        res: Response = await self.session.request(
+            req.method, req.url, headers=req.headers, json=req.json
+        )
+
+        # HTTP 304: Not Modified
+        if (res.status_code == 304) and (cached is not None):
+            log.debug(f"{req.route} not modified, reusing previous response")
+
+            # Models never modify the data they are constructed from, so the
+            # previous response is shared rather than copied.
+            statusCode: int = 200
+            data: Union[dict, str] = cached[2]
+        else:
+            statusCode: int = res.status_code
             data: Union[dict, str] = await JSONorText(res)
-            if isinstance(data, dict):
-                status: Optional[str] = data.get("status")
-
-                # The API tends to return HTTP 200 even when an error occurs
-                if status == "error":
-                    raise HTTPException(res.status_code, data)
-
-            # HTTP 2XX: Success
-            if 300 > res.status_code >= 200:
-                return data
-
-            # HTTP 429: Too Many Requests
-            if res.status_code == 429:
-                # TODO Handle rate limiting
-                raise HTTPException(res.status_code, data)
-
-            # HTTP 500/502: Internal Server Error/Bad Gateway
-            if res.status_code == 500 or res.status_code == 502:
-                # TODO Handle Unconditional retries
-                raise HTTPException(res.status_code, data)
-
-            # HTTP 403: Forbidden
-            if res.status_code == 403:
-                raise Forbidden(res.status_code, data)
-            # HTTP 404: Not Found
-            elif res.status_code == 404:
-                raise NotFound(res.status_code, data)
-            else:
-                raise HTTPException(res.status_code, data)
+
+            if conditional and (statusCode == 200):
+                self._Validate(req, res, data)
+
+        if self.capture is not None:
+            self.capture.Record(req, statusCode, data)
+
+        return self._Handle(statusCode, data)
+
+    def _Validate(self, req: Request, res: Response, data: Union[dict, str]):
+        """Remember the validators of a response for revalidation."""
+
+        etag: Optional[str] = res.headers.get("ETag")
+        lastModified: Optional[str] = res.headers.get("Last-Modified")
+
+        if (etag is None) and (lastModified is None):
+            self._validators.pop(req.url, None)
+
+            return
+
+        self._validators[req.url] = (etag, lastModified, data)
+
+    def _Handle(self, statusCode: int, data: Union[dict, str]) -> Union[dict, str]:
+        """Return the data of a response, or raise the error it represents."""
+
+        if isinstance(data, dict):
+            status: Optional[str] = data.get("status")
+
+            # The API tends to return HTTP 200 even when an error occurs
+            if status == "error":
+                raise HTTPException(statusCode, data)
+
+        # HTTP 2XX: Success
+        if 300 > statusCode >= 200:
+            return data
+
+        # HTTP 429: Too Many Requests
+        if statusCode == 429:
+            # TODO Handle rate limiting
+            raise HTTPException(statusCode, data)
+
+        # HTTP 500/502: Internal Server Error/Bad Gateway
+        if statusCode == 500 or statusCode == 502:
+            # TODO Handle Unconditional retries
+            raise HTTPException(statusCode, data)
+
+        # HTTP 403: Forbidden
+        if statusCode == 403:
+            raise Forbidden(statusCode, data)
+        # HTTP 404: Not Found
+        elif statusCode == 404:
+            raise NotFound(statusCode, data)
+        else:
+            raise HTTPException(statusCode, data)
 
     async def GetAppLocalize(self, language: str) -> Union[dict, str]:
         return await self.Send(
             Request(
                 "GET",
                 f"content/atvi/callofduty/mycod/web/{language}/data/json/iq-content-xapp.js",
+                route="GetAppLocalize",
             )
         )
 
@@ -146,23 +332,31 @@ class HTTP:
             Request(
                 "GET",
                 f"content/atvi/callofduty/mycod/web/{language}/data/json/iq-content-xweb.js",
+                route="GetWebLocalize",
             )
         )
 
     async def GetNewsFeed(self, language: str) -> Union[dict, str]:
-        return await self.Send(Request("GET", f"site/cod/franchiseFeed/{language}"))
+        return await self.Send(
+            Request("GET", f"site/cod/franchiseFeed/{language}", route="GetNewsFeed")
+        )
 
     async def GetVideoFeed(self, language: str) -> Union[dict, str]:
         return await self.Send(
             Request(
                 "GET",
                 f"content/atvi/callofduty/mycod/web/{language}/data/json/videos.js",
+                route="GetVideoFeed",
             )
         )
 
     async def GetFriendFeed(self) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", "api/papi-client/userfeed/v1/friendFeed/rendered/")
+            Request(
+                "GET",
+                "api/papi-client/userfeed/v1/friendFeed/rendered/",
+                route="GetFriendFeed",
+            )
         )
 
     async def SetFeedReaction(self, reaction: str, json: dict) -> Union[dict, str]:
@@ -172,6 +366,7 @@ class HTTP:
                 f"api/papi-client/userfeed/v1/reactions/set/{reaction}/en",
                 baseUrl=Request.myBaseUrl,
                 json=json,
+                route="SetFeedReaction",
             )
         )
 
@@ -182,28 +377,44 @@ class HTTP:
                 f"api/papi-client/userfeed/v1/favorite/set/{set}/en",
                 baseUrl=Request.myBaseUrl,
                 json=json,
+                route="SetFeedFavorite",
             )
         )
 
     async def GetMyIdentities(self) -> Union[dict, str]:
-        return await self.Send(Request("GET", "api/papi-client/crm/cod/v2/identities/"))
+        return await self.Send(
+            Request(
+                "GET", "api/papi-client/crm/cod/v2/identities/", route="GetMyIdentities"
+            )
+        )
 
     async def GetMyAccounts(self) -> Union[dict, str]:
-        return await self.Send(Request("GET", "api/papi-client/crm/cod/v2/accounts/"))
+        return await self.Send(
+            Request(
+                "GET", "api/papi-client/crm/cod/v2/accounts/", route="GetMyAccounts"
+            )
+        )
 
     async def GetMyFriends(self) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", "api/papi-client/codfriends/v1/compendium")
+            Request(
+                "GET", "api/papi-client/codfriends/v1/compendium", route="GetMyFriends"
+            )
         )
 
     async def GetMyFavorites(self) -> Union[dict, str]:
-        return await self.Send(Request("GET", "api/papi-client/relationships/v1/list/"))
+        return await self.Send(
+            Request(
+                "GET", "api/papi-client/relationships/v1/list/", route="GetMyFavorites"
+            )
+        )
 
     async def SearchPlayer(self, platform: str, username: str) -> Union[dict, str]:
         return await self.Send(
             Request(
                 "GET",
                 f"api/papi-client/crm/cod/v2/platform/{platform}/username/{urllib.parse.quote(username)}/search",
+                route="SearchPlayer",
             )
         )
 
@@ -214,6 +425,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/stats/cod/v1/title/{title}/platform/{platform}/gamer/{urllib.parse.quote(username)}/profile/type/{mode}",
+                route="GetPlayerProfile",
             )
         )
 
@@ -231,6 +443,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/crm/cod/v2/title/{title}/platform/{platform}/gamer/{urllib.parse.quote(username)}/matches/{mode}/start/{startTimestamp}/end/{endTimeStamp}?limit={limit}",
+                route="GetPlayerMatches",
             )
         )
 
@@ -244,11 +457,11 @@ class HTTP:
         startTimestamp: int,
         endTimeStamp: int,
     ) -> Union[dict, str]:
-        print(f"api/papi-client/crm/cod/v2/title/{title}/platform/{platform}/gamer/{urllib.parse.quote(username)}/matches/{mode}/start/{startTimestamp}/end/{endTimeStamp}/details?limit={limit}")
         return await self.Send(
             Request(
                 "GET",
                 f"api/papi-client/crm/cod/v2/title/{title}/platform/{platform}/gamer/{urllib.parse.quote(username)}/matches/{mode}/start/{startTimestamp}/end/{endTimeStamp}/details?limit={limit}",
+                route="GetPlayerMatchesDetailed",
             )
         )
 
@@ -259,6 +472,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/ce/v1/title/{title}/platform/{platform}/match/{matchId}/matchMapEvents",
+                route="GetMatch",
             )
         )
 
@@ -275,6 +489,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/leaderboards/v2/title/{title}/platform/{platform}/time/{timeFrame}/type/{gameType}/mode/{gameMode}/page/{page}",
+                route="GetLeaderboard",
             )
         )
 
@@ -291,6 +506,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/leaderboards/v2/title/{title}/platform/{platform}/time/{timeFrame}/type/{gameType}/mode/{gameMode}/gamer/{urllib.parse.quote(username)}",
+                route="GetPlayerLeaderboard",
             )
         )
 
@@ -301,6 +517,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/ce/v1/title/{title}/platform/{platform}/gameType/{mode}/communityMapData/availability",
+                route="GetAvailableMaps",
             )
         )
 
@@ -311,6 +528,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/loot/title/{title}/platform/{platform}/list/loot_season_{season}/{language}",
+                route="GetLootSeason",
             )
         )
 
@@ -321,6 +539,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/loadouts/v3/title/{title}/platform/{platform}/gamer/{urllib.parse.quote(username)}/mode/{mode}",
+                route="GetPlayerLoadouts",
             )
         )
 
@@ -331,17 +550,26 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/zmauth/v1/title/{title}/platform/{platform}/gamer/{urllib.parse.quote(username)}/zombies/match/authenticated/phrase/{urllib.parse.quote(phrase)}",
+                route="GetAuthenticityStamp",
             )
         )
 
     async def AddFriend(self, accountId: int) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", f"api/papi-client/codfriends/v1/invite/uno/id/{accountId}")
+            Request(
+                "GET",
+                f"api/papi-client/codfriends/v1/invite/uno/id/{accountId}",
+                route="AddFriend",
+            )
         )
 
     async def RemoveFriend(self, accountId: int) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", f"api/papi-client/codfriends/v1/remove/uno/id/{accountId}")
+            Request(
+                "GET",
+                f"api/papi-client/codfriends/v1/remove/uno/id/{accountId}",
+                route="RemoveFriend",
+            )
         )
 
     async def AddFavorite(self, platform: str, username: str) -> Union[dict, str]:
@@ -349,6 +577,7 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/relationships/v1/friend/platform/{platform}/gamer/{urllib.parse.quote(username)}/set/fav",
+                route="AddFavorite",
             )
         )
 
@@ -357,17 +586,26 @@ class HTTP:
             Request(
                 "GET",
                 f"api/papi-client/relationships/v1/friend/platform/{platform}/gamer/{urllib.parse.quote(username)}/delete",
+                route="RemoveFavorite",
             )
         )
 
     async def BlockPlayer(self, accountId: int) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", f"api/papi-client/codfriends/v1/block/uno/id/{accountId}")
+            Request(
+                "GET",
+                f"api/papi-client/codfriends/v1/block/uno/id/{accountId}",
+                route="BlockPlayer",
+            )
         )
 
     async def UnblockPlayer(self, accountId: int) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", f"api/papi-client/codfriends/v1/unblock/uno/id/{accountId}")
+            Request(
+                "GET",
+                f"api/papi-client/codfriends/v1/unblock/uno/id/{accountId}",
+                route="UnblockPlayer",
+            )
         )
 
     async def GetSquad(self, name: str) -> Union[dict, str]:
@@ -376,6 +614,7 @@ class HTTP:
                 "GET",
                 f"api/v2/squad/lookup/name/{urllib.parse.quote(name)}",
                 baseUrl=Request.squadsBaseUrl,
+                route="GetSquad",
             )
         )
 
@@ -385,12 +624,18 @@ class HTTP:
                 "GET",
                 f"api/v2/squad/lookup/platform/{platform}/gamer/{urllib.parse.quote(username)}",
                 baseUrl=Request.squadsBaseUrl,
+                route="GetPlayerSquad",
             )
         )
 
     async def GetMySquad(self) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", "api/v2/squad/lookup/mine/", baseUrl=Request.squadsBaseUrl)
+            Request(
+                "GET",
+                "api/v2/squad/lookup/mine/",
+                baseUrl=Request.squadsBaseUrl,
+                route="GetMySquad",
+            )
         )
 
     async def JoinSquad(self, name: str) -> Union[dict, str]:
@@ -399,16 +644,27 @@ class HTTP:
                 "GET",
                 f"api/v2/squad/join/{urllib.parse.quote(name)}",
                 baseUrl=Request.squadsBaseUrl,
+                route="JoinSquad",
             )
         )
 
     async def LeaveSquad(self) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", "api/v2/squad/leave/", baseUrl=Request.squadsBaseUrl)
+            Request(
+                "GET",
+                "api/v2/squad/leave/",
+                baseUrl=Request.squadsBaseUrl,
+                route="LeaveSquad",
+            )
         )
 
     async def ReportSquad(self, id: str) -> Union[dict, str]:
         return await self.Send(
-            Request("GET", f"api/v2/squad/report/{id}", baseUrl=Request.squadsBaseUrl)
+            Request(
+                "GET",
+                f"api/v2/squad/report/{id}",
+                baseUrl=Request.squadsBaseUrl,
+                route="ReportSquad",
+            )
         )
 
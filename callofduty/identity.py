@@ -0,0 +1,364 @@
+import json
+import logging
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .enums import Platform
+from .player import Player
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class IdentityIndex:
+    """
+    Client-side index of the Call of Duty player identities seen in API
+    responses, used to resolve usernames and Account IDs locally.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    intern : bool, optional
+        Boolean indicating whether or not a single Player object is kept for
+        each identity, with newly seen fields merged into it, rather than the
+        most recently seen Player object replacing it (default is False.)
+    maxSize : int, optional
+        Maximum number of recorded identities, the least recently recorded
+        or looked up of which are evicted first (default is 65536.)
+    """
+
+    def __init__(self, client, intern: bool = False, maxSize: int = 65536):
+        self._client = client
+        self.intern: bool = intern
+        self.maxSize: int = maxSize
+
+        self._players: "OrderedDict[Tuple[Platform, str], Player]" = OrderedDict()
+        self._accounts: Dict[str, Dict[Platform, Tuple[Platform, str]]] = {}
+        self._linked: Dict[Tuple[Platform, str], Set[Tuple[Platform, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    @staticmethod
+    def Key(platform: Platform, username: str) -> Tuple[Platform, str]:
+        """Get the index key of a platform and username."""
+
+        return (platform, username.lower())
+
+    def Record(self, player: Player) -> Player:
+        """
+        Record a player, and their linked identities, in the index. The
+        player replaces the previous record, unless only the previous record
+        has an Account ID. Player objects are never modified.
+
+        When interning, the previously recorded Player object is kept and
+        the fields seen on the player are merged into it instead.
+
+        Parameters
+        ----------
+        player : callofduty.Player
+            Player object to record.
+
+        Returns
+        -------
+        callofduty.Player
+            Player object which was recorded, which is the previously
+            recorded Player object when interning.
+        """
+
+        if player.username is None:
+            if (self.intern is not True) or (player.accountId is None):
+                return player
+
+            previous: Optional[Player] = self.LookupAccount(
+                player.accountId, player.platform
+            )
+
+            return player if previous is None else self.Merge(previous, player)
+
+        key: Tuple[Platform, str] = self.Key(player.platform, player.username)
+
+        if (previous := self._players.get(key)) is not None:
+            self._players.move_to_end(key)
+
+            if self.intern is True:
+                return self.Merge(previous, player)
+
+            if (player.accountId is None) and (previous.accountId is not None):
+                # The previous record is the more useful one for resolving
+                # the Account ID, so it is kept.
+                self._Index(key, player)
+
+                return player
+
+            self._Unindex(key, previous)
+
+        self._players[key] = player
+        self._Index(key, player)
+
+        while len(self._players) > self.maxSize:
+            self._Evict(next(iter(self._players)))
+
+        return player
+
+    def RecordMany(self, players: Iterable[Player]) -> List[Player]:
+        """
+        Record multiple players in the index.
+
+        Parameters
+        ----------
+        players : iterable
+            Player objects to record.
+
+        Returns
+        -------
+        list
+            Array of Player objects which were recorded.
+        """
+
+        return [self.Record(player) for player in players]
+
+    def Merge(self, previous: Player, player: Player) -> Player:
+        """
+        Merge the fields seen on a player into the previously recorded
+        Player object of the same identity.
+
+        Parameters
+        ----------
+        previous : callofduty.Player
+            Previously recorded Player object.
+        player : callofduty.Player
+            Player object to merge.
+
+        Returns
+        -------
+        callofduty.Player
+            Previously recorded Player object.
+        """
+
+        if previous is player:
+            return previous
+
+        if player.accountId is not None:
+            previous.accountId = player.accountId
+
+        if player.avatarUrl is not None:
+            previous.avatarUrl = player.avatarUrl
+
+        # Online status defaults to False when absent, so only a status
+        # which was actually seen should overwrite the previous one.
+        if "online" in (player.raw or {}):
+            previous.online = player.online
+
+        if len(player.identities) > 0:
+            identities: Dict[Tuple[Platform, Optional[str]], Player] = {
+                (i.platform, i.username): i for i in previous.identities
+            }
+
+            for identity in player.identities:
+                identities.setdefault((identity.platform, identity.username), identity)
+
+            previous.identities = list(identities.values())
+
+        if previous.username is not None:
+            self._Index(self.Key(previous.platform, previous.username), previous)
+
+        return previous
+
+    def _Evict(self, key: Tuple[Platform, str]):
+        """Remove a recorded identity, and references to it, from the index."""
+
+        self._Unindex(key, self._players.pop(key))
+
+        for linked in self._linked.pop(key, set()):
+            if (keys := self._linked.get(linked)) is not None:
+                keys.discard(key)
+
+                if len(keys) == 0:
+                    del self._linked[linked]
+
+    def _Unindex(self, key: Tuple[Platform, str], player: Player):
+        """Remove the Account ID of a player which is no longer recorded."""
+
+        if player.accountId is not None:
+            accounts: Dict[Platform, Tuple[Platform, str]] = self._accounts.get(
+                str(player.accountId), {}
+            )
+
+            if accounts.get(player.platform) == key:
+                del accounts[player.platform]
+
+                if len(accounts) == 0:
+                    del self._accounts[str(player.accountId)]
+
+    def _Index(self, key: Tuple[Platform, str], player: Player):
+        """Index the Account ID and linked identities of a recorded player."""
+
+        if player.accountId is not None:
+            self._accounts.setdefault(str(player.accountId), {})[player.platform] = key
+
+        identities: List[Player] = []
+
+        for identity in player.identities:
+            if (identity.username is None) or (
+                self.Key(identity.platform, identity.username) == key
+            ):
+                identities.append(identity)
+                continue
+
+            identities.append(self.Record(identity))
+            self.Link(key, self.Key(identity.platform, identity.username))
+
+        if self.intern is True:
+            player.identities = identities
+
+    def Link(self, a: Tuple[Platform, str], b: Tuple[Platform, str]):
+        """Record that two index keys are identities of the same player."""
+
+        if a == b:
+            return
+
+        self._linked.setdefault(a, set()).add(b)
+        self._linked.setdefault(b, set()).add(a)
+
+    def Lookup(self, platform: Platform, username: str) -> Optional[Player]:
+        """
+        Get a recorded player by their platform and username.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform, matched
+            case-insensitively.
+
+        Returns
+        -------
+        callofduty.Player
+            Player object of the recorded player, None if not recorded.
+        """
+
+        key: Tuple[Platform, str] = self.Key(platform, username)
+
+        if (player := self._players.get(key)) is not None:
+            self._players.move_to_end(key)
+
+        return player
+
+    def LookupAccount(
+        self, accountId: Union[int, str], platform: Optional[Platform] = None
+    ) -> Optional[Player]:
+        """
+        Get a recorded player by their Account ID.
+
+        Parameters
+        ----------
+        accountId : int
+            Account ID of the player.
+        platform : callofduty.Platform, optional
+            Platform of the Account ID (default is any platform.)
+
+        Returns
+        -------
+        callofduty.Player
+            Player object of the recorded player, None if not recorded.
+        """
+
+        keys: Dict[Platform, Tuple[Platform, str]] = self._accounts.get(
+            str(accountId), {}
+        )
+
+        if platform is not None:
+            key: Optional[Tuple[Platform, str]] = keys.get(platform)
+        else:
+            key: Optional[Tuple[Platform, str]] = next(iter(keys.values()), None)
+
+        return None if key is None else self._players.get(key)
+
+    def Linked(self, platform: Platform, username: str) -> List[Player]:
+        """
+        Get the recorded identities which are linked to a player.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+
+        Returns
+        -------
+        list
+            Array of Player objects of the linked identities.
+        """
+
+        linked: List[Player] = []
+
+        for key in self._linked.get(self.Key(platform, username), set()):
+            if (player := self._players.get(key)) is not None:
+                linked.append(player)
+
+        return linked
+
+    def Save(self, path: str):
+        """
+        Persist the index to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write.
+        """
+
+        data: List[dict] = []
+
+        for key, player in self._players.items():
+            data.append(
+                {
+                    "platform": player.platform.value,
+                    "username": player.username,
+                    "accountId": player.accountId,
+                    "avatarUrl": player.avatarUrl,
+                    "linked": [
+                        [platform.value, username]
+                        for platform, username in self._linked.get(key, set())
+                    ],
+                }
+            )
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    def Load(self, path: str):
+        """
+        Load a previously persisted index from a JSON file, in addition to
+        the identities which are already recorded.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to read.
+        """
+
+        with open(path, "r", encoding="utf-8") as file:
+            data: List[dict] = json.load(file)
+
+        for entry in data:
+            player: Player = self.Record(
+                Player(
+                    self._client,
+                    {
+                        "platform": entry["platform"],
+                        "username": entry["username"],
+                        "accountId": entry.get("accountId"),
+                        "avatarUrl": entry.get("avatarUrl"),
+                    },
+                )
+            )
+
+            for platform, username in entry.get("linked", []):
+                self.Link(
+                    self.Key(player.platform, player.username),
+                    (Platform(platform), username),
+                )
@@ -1,8 +1,9 @@
 import logging
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 from .enums import GameType, Platform, TimeFrame, Title
-from .object import Object
+from .object import Hydrator, Object
+from .utils import Convert
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -34,26 +35,48 @@ class Leaderboard(Object):
     """
 
     _type: str = "Leaderboard"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.title: Title = Title(data.pop("title"))
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.gameType: GameType = GameType(data.pop("leaderboardType"))
-        self.gameMode: str = data.pop("gameMode")
-        self.timeFrame: TimeFrame = TimeFrame(data.pop("timeFrame"))
-        self.page: int = data.pop("page")
-        self.pages: int = data.pop("totalPages")
-        self.columns: list = data.pop("columns")
-        self.entries: List[LeaderboardEntry] = []
-
-        for entry in data.pop("entries", []):
-            # Leaderboard Entries don't include this value, so we'll just
-            # add it manually.
-            entry["platform"] = self.platform.value
-
-            self.entries.append(LeaderboardEntry(self, entry))
+    _fields: Dict[str, Hydrator] = {
+        "title": lambda self, data: Convert(Title, data["title"]),
+        "platform": lambda self, data: Convert(Platform, data["platform"]),
+        "gameType": lambda self, data: Convert(GameType, data["leaderboardType"]),
+        "gameMode": lambda self, data: data["gameMode"],
+        "timeFrame": lambda self, data: Convert(TimeFrame, data["timeFrame"]),
+        "page": lambda self, data: data["page"],
+        "pages": lambda self, data: data["totalPages"],
+        "columns": lambda self, data: data["columns"],
+        "entries": lambda self, data: self._CreateEntries(data),
+    }
+    __slots__ = (
+        "title",
+        "platform",
+        "gameType",
+        "gameMode",
+        "timeFrame",
+        "page",
+        "pages",
+        "columns",
+        "entries",
+    )
+
+    title: Title
+    platform: Platform
+    gameType: GameType
+    gameMode: str
+    timeFrame: TimeFrame
+    page: int
+    pages: int
+    columns: list
+    entries: List["LeaderboardEntry"]
+
+    def _CreateEntries(self, data: dict) -> List["LeaderboardEntry"]:
+        entries: List[LeaderboardEntry] = []
+
+        # Leaderboard Entries don't include the platform, so it's passed
+        # alongside the entry rather than added to a copy of it.
+        for entry in data.get("entries", []):
+            entries.append(LeaderboardEntry(self, entry, platform=self.platform))
+
+        return entries
 
     async def players(self) -> list:
         """
@@ -96,13 +119,80 @@ class LeaderboardEntry(Object):
     """
 
     _type: str = "LeaderboardEntry"
+    _fields: Dict[str, Hydrator] = {
+        "platform": lambda self, data: Convert(
+            Platform, data.get("platform", self._platform)
+        ),
+        "username": lambda self, data: data["username"],
+        "rank": lambda self, data: int(data["rank"]),
+        "updated": lambda self, data: int(data["updateTime"]),
+        "rating": lambda self, data: data["rating"],
+        "values": lambda self, data: data["values"],
+    }
+    __slots__ = (
+        "platform",
+        "username",
+        "rank",
+        "updated",
+        "rating",
+        "values",
+        "_platform",
+    )
+
+    platform: Platform
+    username: str
+    rank: int
+    updated: int
+    rating: int
+    values: Dict[str, Union[int, float]]
+
+    def __init__(self, client, data: dict, platform: Optional[Platform] = None):
+        # Set before the fields are materialized, as the platform field
+        # falls back to it when the entry doesn't include a platform.
+        self._platform: Optional[Platform] = platform
+
+        super().__init__(client, data)
+
+    @classmethod
+    def fromRaw(
+        cls, client, data: dict, platform: Optional[Platform] = None
+    ) -> "LeaderboardEntry":
+        """
+        Construct a leaderboard entry from JSON data, such as that returned
+        by toRaw.
+
+        Parameters
+        ----------
+        client : callofduty.Client
+            Client which manages communication with the Call of Duty API.
+        data : dict
+            JSON data of the leaderboard entry.
+        platform : callofduty.Platform, optional
+            Platform of the player, if the JSON data doesn't include it
+            (default is None.)
+
+        Returns
+        -------
+        object
+            LeaderboardEntry object constructed from the JSON data.
+        """
+
+        return cls(client, data, platform=platform)
+
+    def toRaw(self) -> Optional[dict]:
+        """
+        Get the JSON data which the leaderboard entry was constructed from,
+        which fromRaw accepts to construct an equal object.
+
+        Returns
+        -------
+        dict
+            JSON data of the leaderboard entry, including the platform.
+        """
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
+        if (self._raw is None) or ("platform" in self._raw):
+            return self._raw
 
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.username: str = data.pop("username")
-        self.rank: int = int(data.pop("rank"))
-        self.updated: int = int(data.pop("updateTime"))
-        self.rating: int = data.pop("rating")
-        self.values: Dict[str, Union[int, float]] = data.pop("values")
+        # Entries of a leaderboard don't include the platform, so only the
+        # returned data is a copy which does.
+        return {**self._raw, "platform": Convert(Platform, self._platform).value}
@@ -1,7 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from .object import Object
+from .object import Hydrator, Object
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -29,29 +29,40 @@ class Loadout(Object):
     """
 
     _type: str = "Loadout"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.name: str = data.pop("customClassName")
-        self.primary: LoadoutWeapon = LoadoutWeapon(self, data.pop("primaryWeapon"))
-        self.secondary: LoadoutWeapon = LoadoutWeapon(self, data.pop("secondaryWeapon"))
-        self.equipment: List[LoadoutItem] = []
-        self.perks: List[LoadoutItem] = []
-        self.wildcards: List[LoadoutItem] = []
-        self.unlocked: bool = data.pop("unlocked")
-
-        if (_equipment := data.pop("equipment")) is not None:
-            self.equipment.append(LoadoutItem(self, _equipment))
-
-        if (_gear := data.pop("gear")) is not None:
-            self.equipment.append(LoadoutItem(self, _gear))
-
-        for _perk in data.pop("perks"):
-            self.perks.append(LoadoutItem(self, _perk))
-
-        for _wildcard in data.pop("wildcards"):
-            self.wildcards.append(LoadoutItem(self, _wildcard))
+    _fields: Dict[str, Hydrator] = {
+        "name": lambda self, data: data["customClassName"],
+        "primary": lambda self, data: LoadoutWeapon(self, data["primaryWeapon"]),
+        "secondary": lambda self, data: LoadoutWeapon(self, data["secondaryWeapon"]),
+        "equipment": lambda self, data: [
+            LoadoutItem(self, item)
+            for item in (data["equipment"], data["gear"])
+            if item is not None
+        ],
+        "perks": lambda self, data: [
+            LoadoutItem(self, _perk) for _perk in data["perks"]
+        ],
+        "wildcards": lambda self, data: [
+            LoadoutItem(self, _wildcard) for _wildcard in data["wildcards"]
+        ],
+        "unlocked": lambda self, data: data["unlocked"],
+    }
+    __slots__ = (
+        "name",
+        "primary",
+        "secondary",
+        "equipment",
+        "perks",
+        "wildcards",
+        "unlocked",
+    )
+
+    name: str
+    primary: "LoadoutWeapon"
+    secondary: "LoadoutWeapon"
+    equipment: List["LoadoutItem"]
+    perks: List["LoadoutItem"]
+    wildcards: List["LoadoutItem"]
+    unlocked: bool
 
 
 class LoadoutWeapon(Object):
@@ -71,30 +82,38 @@ class LoadoutWeapon(Object):
     """
 
     _type: str = "LoadoutWeapon"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.id: str = data.pop("id")
-        self.variant: Optional[str] = None
-        self.attachments: List[LoadoutItem] = []
-        self.camo: bool = data.pop("camoEquipped")
-
-        if (_variant := data.pop("variant")) is not None:
-            self.variant: Optional[str] = _variant["id"]
+    _fields: Dict[str, Hydrator] = {
+        "id": lambda self, data: data["id"],
+        "variant": lambda self, data: (
+            data["variant"]["id"] if data["variant"] is not None else None
+        ),
+        "attachments": lambda self, data: self._CreateAttachments(data),
+        "camo": lambda self, data: data["camoEquipped"],
+    }
+    __slots__ = ("id", "variant", "attachments", "camo")
+
+    id: str
+    variant: Optional[str]
+    attachments: List["LoadoutItem"]
+    camo: bool
+
+    def _CreateAttachments(self, data: dict) -> List["LoadoutItem"]:
+        attachments: List[LoadoutItem] = []
 
         # Optics and Operator Mods are attachments, there's no reason to
         # seperate them from the attachments array.
         # This is also to (hopefully) make Modern Warfare support easier.
-        if (_optic := data.pop("optic")) is not None:
-            self.attachments.append(LoadoutItem(self, _optic))
+        if (_optic := data["optic"]) is not None:
+            attachments.append(LoadoutItem(self, _optic))
 
-        if (_opMod := data.pop("operatorMod")) is not None:
-            self.attachments.append(LoadoutItem(self, _opMod))
+        if (_opMod := data["operatorMod"]) is not None:
+            attachments.append(LoadoutItem(self, _opMod))
 
-        if (_attachments := data.pop("attachments")) is not None:
+        if (_attachments := data["attachments"]) is not None:
             for _attachment in _attachments:
-                self.attachments.append(LoadoutItem(self, _attachment))
+                attachments.append(LoadoutItem(self, _attachment))
+
+        return attachments
 
 
 class LoadoutItem(Object):
@@ -108,8 +127,7 @@ class LoadoutItem(Object):
     """
 
     _type: str = "LoadoutItem"
+    _fields: Dict[str, Hydrator] = {"id": lambda self, data: data["id"]}
+    __slots__ = ("id",)
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.id: str = data.pop("id")
+    id: str
@@ -0,0 +1,56 @@
+import logging
+from typing import Dict, Optional
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class Localization(dict):
+    """
+    Represents the localized strings used by the Call of Duty Companion App
+    and website, keyed by their localization key.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._index: Optional[Dict[str, str]] = None
+
+    def __setitem__(self, key: str, value: str):
+        super().__setitem__(key, value)
+
+        self._index = None
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+
+        self._index = None
+
+    def Translate(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get the localized string for a stat or item key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the localized string, matched case-insensitively.
+        default : str, optional
+            Value to return if the key isn't localized (default is None.)
+
+        Returns
+        -------
+        str
+            Localized string for the key.
+        """
+
+        if (value := self.get(key)) is not None:
+            return value
+
+        # Stat and item keys don't consistently match the casing used by
+        # the localization data, so fall back to a lowercase index which
+        # is built once upon first use.
+        if self._index is None:
+            self._index = {k.lower(): v for k, v in self.items()}
+
+        return self._index.get(key.lower(), default)
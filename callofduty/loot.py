@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .enums import Language, Platform, Title
-from .object import Object
+from .object import Hydrator, Object
+from .utils import Convert
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -30,23 +31,28 @@ class Season(Object):
     """
 
     _type: str = "Season"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.title: Title = Title(data.pop("title"))
-        self.season: int = data.pop("season")
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.name: Optional[str] = data.pop("categoryTitle", None)
-        self.tiers: List[LootItem] = []
-        self.chase: List[LootItem] = []
-        self.language: Language = Language(data.pop("language"))
-
-        for tier in (_tiers := data.pop("tiers", [])) :
-            self.tiers.append(LootItem(self, _tiers[tier]))
-
-        for chase in (_chase := data.pop("chase", [])) :
-            self.chase.append(LootItem(self, _chase[chase]))
+    _fields: Dict[str, Hydrator] = {
+        "title": lambda self, data: Convert(Title, data["title"]),
+        "season": lambda self, data: data["season"],
+        "platform": lambda self, data: Convert(Platform, data["platform"]),
+        "name": lambda self, data: data.get("categoryTitle"),
+        "tiers": lambda self, data: [
+            LootItem(self, item) for item in data.get("tiers", {}).values()
+        ],
+        "chase": lambda self, data: [
+            LootItem(self, item) for item in data.get("chase", {}).values()
+        ],
+        "language": lambda self, data: Convert(Language, data["language"]),
+    }
+    __slots__ = ("title", "season", "platform", "name", "tiers", "chase", "language")
+
+    title: Title
+    season: int
+    platform: Platform
+    name: Optional[str]
+    tiers: List["LootItem"]
+    chase: List["LootItem"]
+    language: Language
 
 
 class LootItem(Object):
@@ -72,14 +78,21 @@ class LootItem(Object):
     """
 
     _type: str = "LootItem"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.id: str = data.pop("name")
-        self.name: str = data.pop("label")
-        self.category: str = data.pop("type")
-        self.rarity: str = data.pop("rarity")
-        self.tier: int = int(data.pop("tier"))
-        self.image: str = data.pop("image")
-        self.free: bool = data.pop("free", False)
+    _fields: Dict[str, Hydrator] = {
+        "id": lambda self, data: data["name"],
+        "name": lambda self, data: data["label"],
+        "category": lambda self, data: data["type"],
+        "rarity": lambda self, data: data["rarity"],
+        "tier": lambda self, data: int(data["tier"]),
+        "image": lambda self, data: data["image"],
+        "free": lambda self, data: data.get("free", False),
+    }
+    __slots__ = ("id", "name", "category", "rarity", "tier", "image", "free")
+
+    id: str
+    name: str
+    category: str
+    rarity: str
+    tier: int
+    image: str
+    free: bool
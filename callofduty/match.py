@@ -1,9 +1,11 @@
+import asyncio
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from .enums import Platform, Title
-from .object import Object
+from .object import Hydrator, Object
 from .player import Player
+from .utils import Convert
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -20,21 +22,57 @@ class Match(Object):
         Platform of the player.
     title : callofduty.Title
         Title which the match took place.
+    data : dict, optional
+        JSON data of the match from the player's match history, which
+        includes the player's stats when sourced from the Activision
+        platform (default is None.)
     """
 
     _type: str = "Match"
+    _fields: Dict[str, Hydrator] = {
+        "id": lambda self, data: data["id"],
+        "platform": lambda self, data: Convert(Platform, data["platform"]),
+        "title": lambda self, data: Convert(Title, data["title"]),
+        "data": lambda self, data: data.get("data"),
+    }
+    _transient: Tuple[str, ...] = ("_details",)
+    __slots__ = ("id", "platform", "title", "data", "_details")
+
+    id: int
+    platform: Platform
+    title: Title
+    data: Optional[dict]
 
     def __init__(self, client, data: dict):
-        super().__init__(client)
+        super().__init__(client, data)
+
+        # Both teams() and details() are derived from the matchMapEvents
+        # payload, which is only requested once per Match.
+        self._details: Optional[asyncio.Future] = None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Match):
+            return NotImplemented
 
-        self.id: int = data.pop("id")
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.title: Title = Title(data.pop("title"))
+        return (self.title, self.platform, str(self.id)) == (
+            other.title,
+            other.platform,
+            str(other.id),
+        )
 
-    async def teams(self) -> List[List[Player]]:
+    def __hash__(self) -> int:
+        return hash((self.title, self.platform, str(self.id)))
+
+    async def teams(self, **kwargs) -> List[List[Player]]:
         """
         Get the teams which played in the match.
 
+        Parameters
+        ----------
+        refresh : bool, optional
+            Boolean indicating whether or not to request the match details
+            again rather than using the previous response (default is False.)
+
         Returns
         -------
         list
@@ -43,16 +81,38 @@ class Match(Object):
             players on the team.
         """
 
-        return await self._client.GetMatchTeams(self.title, self.platform, self.id)
+        return self._client._CreateMatchTeams(await self.details(**kwargs))
 
-    async def details(self) -> dict:
+    async def details(self, **kwargs) -> dict:
         """
         Get the full details of the match.
 
+        Parameters
+        ----------
+        refresh : bool, optional
+            Boolean indicating whether or not to request the match details
+            again rather than using the previous response (default is False.)
+
         Returns
         -------
         dict
             JSON data containing the full details of the match.
         """
 
-        return await self._client.GetMatchDetails(self.title, self.platform, self.id)
+        if (self._details is None) or (kwargs.get("refresh", False) is True):
+            self._details = asyncio.ensure_future(
+                self._client.GetMatchDetails(self.title, self.platform, self.id)
+            )
+
+        details: asyncio.Future = self._details
+
+        try:
+            # Shield the shared request so that one cancelled caller doesn't
+            # cancel it for every other caller awaiting the same details.
+            return await asyncio.shield(details)
+        except Exception:
+            # Don't memoize failures, the next call should try again.
+            if self._details is details:
+                self._details = None
+
+            raise
@@ -1,23 +1,218 @@
+import copy
 import logging
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Function which materializes a field of an Object from its JSON data.
+Hydrator = Callable[["Object", dict], Any]
+
 
 class Object:
     """
     Represents a generic Call of Duty object.
 
+    Fields are materialized from the JSON data by the hydrators in _fields,
+    either all at once upon construction or, when the client is lazy, each
+    upon first access. Fields in _deferred are always materialized upon
+    first access. The JSON data is only read, never modified, and is kept
+    as the raw attribute.
+
     Parameters
     ----------
     client : callofduty.Client
         Client which manages communication with the Call of Duty API.
+    data : dict, optional
+        JSON data of the object (default is None.)
+    raw : dict
+        JSON data which the object was constructed from, shared rather
+        than copied, so it should not be modified.
     """
 
     _type: Optional[str] = None
+    _fields: Dict[str, Hydrator] = {}
+    # Costly fields which are seldom read, never materialized upon construction.
+    _deferred: Tuple[str, ...] = ()
+    _eager: Dict[str, Hydrator] = {}
+    # Slots which are bound to the running process, such as pending requests,
+    # shared between copies and never pickled.
+    _transient: Tuple[str, ...] = ()
+    __slots__ = ("_client", "_raw")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-    def __init__(self, client):
+        cls._eager = {
+            name: hydrate
+            for name, hydrate in cls._fields.items()
+            if name not in cls._deferred
+        }
+
+    def __init__(self, client, data: Optional[dict] = None):
         self._client = client
+        self._raw: Optional[dict] = data
+
+        if data is None:
+            return
+
+        # Nested objects are constructed with their parent as the client.
+        while isinstance(client, Object):
+            client = client._client
+
+        if getattr(client, "lazy", False) is not True:
+            for name, hydrate in self._eager.items():
+                setattr(self, name, hydrate(self, data))
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, which for a field means that
+        # it has not been materialized yet.
+        if ((hydrate := self._fields.get(name)) is None) or (self._raw is None):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        value: Any = hydrate(self, self._raw)
+        setattr(self, name, value)
+
+        return value
+
+    def _Record(self, players):
+        """
+        Record players in the identity index of the client, returning the
+        recorded Player objects which replace them when interning.
+        """
+
+        if (record := getattr(self._client, "_Record", None)) is None:
+            return players
+
+        return record(players)
+
+    @classmethod
+    def fromRaw(cls, client, data: dict) -> "Object":
+        """
+        Construct an object from JSON data, such as that returned by toRaw.
+
+        Parameters
+        ----------
+        client : callofduty.Client
+            Client which manages communication with the Call of Duty API.
+        data : dict
+            JSON data of the object.
+
+        Returns
+        -------
+        object
+            Object constructed from the JSON data.
+        """
+
+        return cls(client, data)
+
+    def toRaw(self) -> Optional[dict]:
+        """
+        Get the JSON data which the object was constructed from, which
+        fromRaw accepts to construct an equal object.
+
+        Returns
+        -------
+        dict
+            JSON data of the object, shared rather than copied.
+        """
+
+        return self._raw
+
+    def bind(self, client) -> "Object":
+        """
+        Bind the object, and the objects nested within it, to a client, such
+        as after it was unpickled or constructed without one.
+
+        Parameters
+        ----------
+        client : callofduty.Client
+            Client which manages communication with the Call of Duty API.
+
+        Returns
+        -------
+        object
+            The object itself.
+        """
+
+        bound: Set[int] = set()
+        pending: List[Object] = [self]
+
+        while len(pending) > 0:
+            if id(obj := pending.pop()) in bound:
+                continue
+
+            bound.add(id(obj))
+
+            # Nested objects constructed with their parent as the client
+            # reach the client through it.
+            if isinstance(obj._client, Object) is False:
+                obj._client = client
+
+            for name, value in obj._Slots():
+                if name in obj._transient:
+                    continue
+                elif isinstance(value, Object):
+                    pending.append(value)
+                elif isinstance(value, (list, tuple)):
+                    pending.extend(i for i in value if isinstance(i, Object))
+
+        return self
+
+    def _Slots(self) -> Iterator[Tuple[str, Any]]:
+        """Get the names and values of the slots which are set."""
+
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                try:
+                    # Bypasses __getattr__, so fields aren't materialized.
+                    yield (name, object.__getattribute__(self, name))
+                except AttributeError:
+                    pass
+
+    def __copy__(self) -> "Object":
+        clone: Object = self.__class__.__new__(self.__class__)
+
+        for name, value in self._Slots():
+            setattr(clone, name, value)
+
+        return clone
+
+    def __deepcopy__(self, memo: dict) -> "Object":
+        clone: Object = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+
+        for name, value in self._Slots():
+            if (name in self._transient) or (
+                (name == "_client") and (isinstance(value, Object) is False)
+            ):
+                setattr(clone, name, value)
+            else:
+                setattr(clone, name, copy.deepcopy(value, memo))
+
+        return clone
+
+    def __reduce__(self) -> tuple:
+        # The client is bound to an event loop and session which cannot be
+        # transferred, so objects are unpickled unbound, see bind.
+        return (self.__class__.fromRaw, (None, None), self.__getstate__())
+
+    def __getstate__(self) -> dict:
+        return {
+            name: value
+            for name, value in self._Slots()
+            if (name not in self._transient)
+            and ((name != "_client") or isinstance(value, Object))
+        }
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def raw(self) -> Optional[dict]:
+        return self._raw
 
     @property
     def type(self) -> Optional[str]:
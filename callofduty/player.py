@@ -1,10 +1,12 @@
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .enums import Mode, Platform, Title
 from .errors import InvalidPlatform
 from .loadout import Loadout, LoadoutItem
-from .object import Object
+from .object import Hydrator, Object
+from .utils import Convert
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -30,16 +32,53 @@ class Player(Object):
     """
 
     _type: str = "Player"
-
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.username: str = data.pop("username")
-        self.accountId: Optional[int] = data.pop("accountId", None)
-        self.avatarUrl: Optional[str] = data.pop("avatarUrl", None)
-        self.online: bool = data.pop("online", False)
-        self.identities: List[Player] = data.pop("identities", [])
+    _fields: Dict[str, Hydrator] = {
+        "platform": lambda self, data: Convert(Platform, data["platform"]),
+        "username": lambda self, data: data["username"],
+        "accountId": lambda self, data: data.get("accountId"),
+        "avatarUrl": lambda self, data: data.get("avatarUrl"),
+        "online": lambda self, data: data.get("online", False),
+        "identities": lambda self, data: data.get("identities", []),
+    }
+    _transient: Tuple[str, ...] = ("_loadouts",)
+    __slots__ = (
+        "platform",
+        "username",
+        "accountId",
+        "avatarUrl",
+        "online",
+        "identities",
+        "_loadouts",
+    )
+
+    platform: Platform
+    username: str
+    accountId: Optional[int]
+    avatarUrl: Optional[str]
+    online: bool
+    identities: List["Player"]
+
+    # The loadouts endpoint is slow, so its response is shared between
+    # loadouts() and loadoutUnlocks() for each title and mode. Set upon the
+    # first request, as most players never fetch their loadouts.
+    _loadouts: Dict[Tuple[Title, Mode], asyncio.Future]
+
+    def _Key(self) -> tuple:
+        # Usernames are case-insensitive, players which are only known by
+        # their Account ID are identified by it instead.
+        if self.username is None:
+            return (self.platform, None, str(self.accountId))
+
+        return (self.platform, self.username.lower())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Player):
+            return NotImplemented
+
+        return self._Key() == other._Key()
+
+    def __hash__(self) -> int:
+        return hash(self._Key())
 
     async def profile(self, title: Title, mode: Mode) -> dict:
         """
@@ -156,6 +195,9 @@ class Player(Object):
             Call of Duty title to get the player's loadouts from.
         mode: callofduty.Mode, optional
             Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether or not to request the loadouts again
+            rather than using the previous response (default is False.)
 
         Returns
         -------
@@ -163,9 +205,7 @@ class Player(Object):
             Array of loadout objects.
         """
 
-        return await self._client.GetPlayerLoadouts(
-            self.platform, self.username, title, **kwargs
-        )
+        return (await self.loadoutsAndUnlocks(title, **kwargs))["loadouts"]
 
     async def loadoutUnlocks(self, title: Title, **kwargs) -> List[LoadoutItem]:
         """
@@ -177,6 +217,9 @@ class Player(Object):
             Call of Duty title to get the player's loadout unlocks from.
         mode: callofduty.Mode, optional
             Call of Duty mode to get the player's loadout unlocks from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether or not to request the loadout unlocks
+            again rather than using the previous response (default is False.)
 
         Returns
         -------
@@ -184,9 +227,55 @@ class Player(Object):
             Array of loadout item objects.
         """
 
-        return await self._client.GetPlayerLoadoutUnlocks(
-            self.platform, self.username, title, **kwargs
-        )
+        return (await self.loadoutsAndUnlocks(title, **kwargs))["unlocks"]
+
+    async def loadoutsAndUnlocks(self, title: Title, **kwargs) -> dict:
+        """
+        Get the Call of Duty player's loadouts and loadout unlocks for the
+        specified title and mode.
+
+        Parameters
+        ----------
+        title : callofduty.Title
+            Call of Duty title to get the player's loadouts from.
+        mode: callofduty.Mode, optional
+            Call of Duty mode to get the player's loadouts from (default is Multiplayer.)
+        refresh : bool, optional
+            Boolean indicating whether or not to request the loadouts again
+            rather than using the previous response (default is False.)
+
+        Returns
+        -------
+        dict
+            JSON data containing an array of loadout objects and an array
+            of loadout item objects for the available unlocks.
+        """
+
+        mode: Mode = kwargs.get("mode", Mode.Multiplayer)
+        key: Tuple[Title, Mode] = (title, mode)
+
+        try:
+            self._loadouts
+        except AttributeError:
+            self._loadouts = {}
+
+        if (key not in self._loadouts) or (kwargs.get("refresh", False) is True):
+            self._loadouts[key] = asyncio.ensure_future(
+                self._client.GetPlayerLoadoutsAndUnlocks(
+                    self.platform, self.username, title, mode=mode
+                )
+            )
+
+        loadouts: asyncio.Future = self._loadouts[key]
+
+        try:
+            return await asyncio.shield(loadouts)
+        except Exception:
+            # Don't memoize failures, the next call should try again.
+            if self._loadouts.get(key) is loadouts:
+                del self._loadouts[key]
+
+            raise
 
     async def authenticityStamp(self, phrase: str, **kwargs):
         """
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .enums import Platform
+from .player import Player
+from .watch import Watcher
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class ScheduledPlayer:
+    """
+    Represents the activity state of a player tracked by an ActivityScheduler.
+
+    Parameters
+    ----------
+    player : callofduty.Player
+        Player object of the tracked player.
+    online : bool, optional
+        Boolean indicating whether or not the player was online when the
+        friends list was last requested (default is the online status of
+        the Player object.)
+    refreshed : float, optional
+        Monotonic time at which the player was last refreshed (default is None.)
+    lastMatch : float, optional
+        Unix timestamp of the player's most recent match (default is None.)
+    """
+
+    __slots__ = ("player", "online", "refreshed", "lastMatch")
+
+    def __init__(self, player: Player, online: Optional[bool] = None):
+        self.player: Player = player
+        self.online: bool = player.online if online is None else online
+        self.refreshed: Optional[float] = None
+        self.lastMatch: Optional[float] = None
+
+    @property
+    def age(self) -> float:
+        """Number of seconds since the player was last refreshed."""
+
+        if self.refreshed is None:
+            return float("inf")
+
+        return time.monotonic() - self.refreshed
+
+
+def ActivityScore(state: ScheduledPlayer) -> float:
+    """
+    Default scoring function of the ActivityScheduler, which favors online
+    players and players who have recently played a match.
+
+    Parameters
+    ----------
+    state : callofduty.ScheduledPlayer
+        Activity state of the tracked player.
+
+    Returns
+    -------
+    float
+        Relative refresh priority of the player.
+    """
+
+    score: float = 1
+
+    if state.online:
+        score += 20
+
+    if state.lastMatch is not None:
+        # Decay the recent match bonus, which halves after one hour and is
+        # a tenth of its initial value after nine.
+        hours: float = max(0, time.time() - state.lastMatch) / 3600
+        score += 10 / (1 + hours)
+
+    return score
+
+
+class ActivityScheduler(Watcher):
+    """
+    Allocate a fixed request budget across tracked Call of Duty players,
+    refreshing online and recently active players often and offline
+    players rarely.
+
+    Each step refreshes the player with the highest score multiplied by
+    the time since their last refresh, except that any player older than
+    maxStaleness is refreshed first. Online status is taken from the
+    friends list of the authenticated player. The result of every refresh
+    is emitted as a (Player, result) tuple.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    refresh : callable
+        Coroutine function which is called with the Player to refresh.
+    budget : float, optional
+        Number of requests which may be made per minute, including those
+        used for online status (default is 60.)
+    maxStaleness : float, optional
+        Maximum number of seconds between refreshes of any player,
+        provided the budget allows refreshing every player within it
+        (default is 3600.)
+    score : callable, optional
+        Function which scores a ScheduledPlayer (default is ActivityScore.)
+    presenceInterval : float, optional
+        Number of seconds between requests for the friends list (default
+        is 120, None to disable.)
+    **kwargs
+        Options which are passed to the Watcher, see callofduty.Watcher.
+    """
+
+    def __init__(self, client, refresh: Callable[[Player], Awaitable[Any]], **kwargs):
+        super().__init__(client, **kwargs)
+
+        self.refresh: Callable[[Player], Awaitable[Any]] = refresh
+        self.budget: float = kwargs.get("budget", 60)
+        self.maxStaleness: float = kwargs.get("maxStaleness", 3600)
+        self.score: Callable[[ScheduledPlayer], float] = kwargs.get(
+            "score", ActivityScore
+        )
+        self.presenceInterval: Optional[float] = kwargs.get("presenceInterval", 120)
+
+        self.players: Dict[Tuple[Platform, str], ScheduledPlayer] = {}
+        self._presence: Optional[float] = None
+
+    def Track(self, player: Player) -> ScheduledPlayer:
+        """
+        Begin scheduling refreshes of the specified player.
+
+        Parameters
+        ----------
+        player : callofduty.Player
+            Player object of the player to track.
+
+        Returns
+        -------
+        callofduty.ScheduledPlayer
+            Activity state of the tracked player.
+        """
+
+        key: Tuple[Platform, str] = (player.platform, player.username)
+
+        if key not in self.players:
+            self.players[key] = ScheduledPlayer(player)
+
+            # Requests for online status are spent from the same budget.
+            budget: float = self.budget
+
+            if self.presenceInterval is not None:
+                budget -= 60 / self.presenceInterval
+
+            if (len(self.players) / self.maxStaleness) > (budget / 60):
+                log.warning(
+                    f"Budget of {self.budget} requests per minute cannot refresh {len(self.players)} players within {self.maxStaleness} seconds"
+                )
+
+        return self.players[key]
+
+    def Untrack(self, player: Player):
+        """
+        Stop scheduling refreshes of the specified player.
+
+        Parameters
+        ----------
+        player : callofduty.Player
+            Player object of the player to untrack.
+        """
+
+        self.players.pop((player.platform, player.username), None)
+
+    def RecordMatch(self, player: Player, timestamp: float):
+        """
+        Record the time of a tracked player's most recent match.
+
+        Parameters
+        ----------
+        player : callofduty.Player
+            Player object of the tracked player.
+        timestamp : float
+            Unix timestamp of the match.
+        """
+
+        if (state := self.players.get((player.platform, player.username))) is None:
+            return
+
+        if (state.lastMatch is None) or (timestamp > state.lastMatch):
+            state.lastMatch = timestamp
+
+    def Next(self) -> Optional[ScheduledPlayer]:
+        """
+        Determine which tracked player should be refreshed next.
+
+        Returns
+        -------
+        callofduty.ScheduledPlayer
+            Activity state of the player to refresh, None if no players
+            are tracked.
+        """
+
+        best: Optional[ScheduledPlayer] = None
+        bestPriority: Tuple[int, float] = (-1, 0)
+
+        for state in self.players.values():
+            age: float = state.age
+
+            # Stale players are refreshed first, oldest first, regardless
+            # of their score.
+            if age >= self.maxStaleness:
+                priority: Tuple[int, float] = (1, age)
+            else:
+                priority: Tuple[int, float] = (0, self.score(state) * age)
+
+            if priority > bestPriority:
+                best, bestPriority = state, priority
+
+        return best
+
+    async def Step(self) -> Optional[Any]:
+        """
+        Spend a single request, either on online status or on refreshing
+        the next player.
+
+        Returns
+        -------
+        object
+            Result of the refresh, None if no player was refreshed.
+        """
+
+        if (self.presenceInterval is not None) and (
+            (self._presence is None)
+            or ((time.monotonic() - self._presence) >= self.presenceInterval)
+        ):
+            self._presence = time.monotonic()
+            await self.UpdatePresence()
+
+            return None
+
+        if (state := self.Next()) is None:
+            return None
+
+        state.refreshed = time.monotonic()
+        result: Any = await self.refresh(state.player)
+
+        await self._Emit((state.player, result))
+
+        return result
+
+    async def UpdatePresence(self):
+        """Update the online status of tracked players from the friends list."""
+
+        online: Dict[Tuple[Platform, str], bool] = {}
+
+        for friend in await self._client.GetMyFriends():
+            online[(friend.platform, friend.username)] = friend.online
+
+            for identity in friend.identities:
+                online[(identity.platform, identity.username)] = friend.online
+
+        for key, state in self.players.items():
+            state.online = online.get(key, False)
+
+    async def _Run(self):
+        while True:
+            started: float = time.monotonic()
+
+            try:
+                await self.Step()
+            except Exception as e:
+                log.warning(f"{self.__class__.__name__} step failed, {e}")
+
+            # Pace the steps so that no more than budget requests are made
+            # per minute.
+            elapsed: float = time.monotonic() - started
+            await asyncio.sleep(max(0, (60 / self.budget) - elapsed))
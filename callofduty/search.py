@@ -0,0 +1,237 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .enums import Platform
+from .player import Player
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class PlayerSearch:
+    """
+    Prefix-cached Call of Duty player search, intended for typeahead.
+
+    Results are cached by platform and normalized query. When a cached
+    result for a shorter prefix of the query is known to be complete, the
+    query is answered by filtering that result locally.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    ttl : float, optional
+        Number of seconds for which search results are cached (default is 60.)
+    debounce : float, optional
+        Number of seconds which Type waits for further input before
+        searching (default is 0.2.)
+    pageSize : int, optional
+        Number of results below which a search result is considered to
+        contain every matching player (default is 10.)
+    maxSize : int, optional
+        Maximum number of cached search results, expired results are purged
+        first and then the least recently stored (default is 1024.)
+    """
+
+    def __init__(self, client, **kwargs):
+        self._client = client
+
+        self.ttl: float = kwargs.get("ttl", 60)
+        self.debounce: float = kwargs.get("debounce", 0.2)
+        self.pageSize: int = kwargs.get("pageSize", 10)
+        self.maxSize: int = kwargs.get("maxSize", 1024)
+
+        self._cache: Dict[Tuple[Platform, str], Tuple[float, asyncio.Future]] = {}
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+
+    async def Search(self, platform: Platform, username: str, **kwargs) -> List[Player]:
+        """
+        Search Call of Duty players by platform and username, using cached
+        results where possible.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the players from.
+        username : str
+            Player's username, or the beginning of it, for the designated platform.
+        limit : int, optional
+            Number of search results to return (default is None.)
+
+        Returns
+        -------
+        list
+            Array of Player objects matching the query.
+        """
+
+        data: List[dict] = await self._Search(platform, self.Normalize(username))
+
+        limit: int = kwargs.get("limit", 0)
+        if limit > 0:
+            data = data[:limit]
+
+        results: List[Player] = []
+        for player in data:
+            results.append(self._client._CreateSearchResult(player))
+
+        return results
+
+    async def Type(
+        self, platform: Platform, username: str, **kwargs
+    ) -> Optional[List[Player]]:
+        """
+        Search Call of Duty players as the query is typed. The search is
+        debounced, and any search still waiting or in flight from a previous
+        call of the same session is superseded.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform to get the players from.
+        username : str
+            Player's username, or the beginning of it, for the designated platform.
+        limit : int, optional
+            Number of search results to return (default is None.)
+        session : hashable, optional
+            Key of the caller typing the query, such as a connection ID,
+            so that concurrent callers don't supersede each other's
+            searches (default is None, which is shared by every caller.)
+
+        Returns
+        -------
+        list
+            Array of Player objects matching the query, None if the search
+            was superseded by a later call.
+        """
+
+        session: Hashable = kwargs.pop("session", None)
+
+        if (previous := self._pending.get(session)) is not None:
+            previous.cancel()
+
+        task: asyncio.Task = asyncio.ensure_future(
+            self._Debounced(platform, username, **kwargs)
+        )
+        self._pending[session] = task
+
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if self._pending.get(session) is not task:
+                return None
+
+            raise
+        finally:
+            if self._pending.get(session) is task:
+                del self._pending[session]
+
+    async def _Debounced(
+        self, platform: Platform, username: str, **kwargs
+    ) -> List[Player]:
+        # Answer immediately when the query can be served from the cache,
+        # only network requests are worth debouncing.
+        if self._Cached(platform, self.Normalize(username)) is None:
+            await asyncio.sleep(self.debounce)
+
+        return await self.Search(platform, username, **kwargs)
+
+    async def _Search(self, platform: Platform, query: str) -> List[dict]:
+        key: Tuple[Platform, str] = (platform, query)
+
+        if (cached := self._Cached(platform, query)) is None:
+            cached = (
+                time.monotonic(),
+                asyncio.ensure_future(
+                    self._client.http.SearchPlayer(platform.value, query)
+                ),
+            )
+            self._Store(key, cached)
+
+        try:
+            # Superseded typeahead searches are cancelled, but the shared
+            # request still completes and populates the cache.
+            data: dict = await asyncio.shield(cached[1])
+        except Exception:
+            if self._cache.get(key) is cached:
+                del self._cache[key]
+
+            raise
+
+        return data["data"]
+
+    def _Cached(
+        self, platform: Platform, query: str
+    ) -> Optional[Tuple[float, asyncio.Future]]:
+        """Get the cached search for the query, or derive it from a shorter prefix."""
+
+        now: float = time.monotonic()
+
+        if (cached := self._cache.get((platform, query))) is not None:
+            if (not cached[1].done()) or ((now - cached[0]) < self.ttl):
+                return cached
+
+        for i in range(len(query) - 1, 0, -1):
+            prefix: Optional[Tuple[float, asyncio.Future]] = self._cache.get(
+                (platform, query[:i])
+            )
+
+            if (
+                (prefix is None)
+                or (not prefix[1].done())
+                or ((now - prefix[0]) >= self.ttl)
+            ):
+                continue
+
+            if prefix[1].cancelled() or (prefix[1].exception() is not None):
+                continue
+
+            data: List[dict] = prefix[1].result()["data"]
+
+            if len(data) >= self.pageSize:
+                # The shorter prefix may have matched more players than
+                # were returned, so it can't answer this query.
+                continue
+
+            future: asyncio.Future = asyncio.get_event_loop().create_future()
+            future.set_result(
+                {
+                    "data": [
+                        player
+                        for player in data
+                        if self.Normalize(player["username"]).startswith(query)
+                    ]
+                }
+            )
+
+            cached = (prefix[0], future)
+            self._Store((platform, query), cached)
+
+            return cached
+
+        return None
+
+    def _Store(self, key: Tuple[Platform, str], cached: Tuple[float, asyncio.Future]):
+        """Cache a search, evicting entries once the cache is full."""
+
+        # Replaced entries move to the end, as the most recently stored.
+        self._cache.pop(key, None)
+        self._cache[key] = cached
+
+        if len(self._cache) <= self.maxSize:
+            return
+
+        now: float = time.monotonic()
+
+        for k, (stored, future) in list(self._cache.items()):
+            if future.done() and ((now - stored) >= self.ttl):
+                del self._cache[k]
+
+        while len(self._cache) > self.maxSize:
+            del self._cache[next(iter(self._cache))]
+
+    @staticmethod
+    def Normalize(username: str) -> str:
+        """Normalize a search query for use as a cache key."""
+
+        return username.strip().lower()
@@ -0,0 +1,239 @@
+import json
+import logging
+from datetime import datetime
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, FrozenSet, List, Tuple, Type
+
+from . import enums
+from .errors import ClientException
+from .object import Object
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Leading byte of serialized data which identifies its format, so that data
+# dumped with msgpack is not mistaken for JSON, or vice versa.
+_msgpack: bytes = b"M"
+_json: bytes = b"J"
+
+# Leading element of the arrays which represent lists, models, enums, dates
+# and references to a dict or model encoded earlier, every other array
+# represents a dict, led by the index of its keys in the table.
+_list: int = -1
+_model: int = -2
+_enum: int = -3
+_datetime: int = -4
+_reference: int = -5
+
+# Types which are represented as themselves.
+_scalars: FrozenSet[type] = frozenset((str, int, float, bool, type(None)))
+
+_models: Dict[str, Type[Object]] = {}
+
+
+def _Models() -> Dict[str, Type[Object]]:
+    """Map the type of every model to its class."""
+
+    if len(_models) == 0:
+        pending: list = [Object]
+
+        while len(pending) > 0:
+            for cls in pending.pop().__subclasses__():
+                if cls._type is not None:
+                    _models[cls._type] = cls
+
+                pending.append(cls)
+
+    return _models
+
+
+class _Encoder:
+    """
+    Encodes a value into arrays which reference a shared table of dict
+    keys, so that the keys of similar dicts, such as the entries of a
+    leaderboard, are only stored once.
+
+    Dicts and models which occur more than once, such as the JSON data of a
+    leaderboard entry which is also held by the leaderboard, are encoded
+    once and referenced by the order in which they were first encoded.
+    """
+
+    def __init__(self):
+        self.keys: Dict[Tuple[Any, ...], int] = {}
+        self.types: Dict[str, int] = {}
+        self.references: Dict[int, int] = {}
+
+    def Encode(self, value: Any) -> Any:
+        if (cls := type(value)) in _scalars:
+            return value
+        elif (cls is dict) or isinstance(value, Object):
+            if (reference := self.references.get(id(value))) is not None:
+                return [_reference, reference]
+
+            self.references[id(value)] = len(self.references)
+
+            if cls is dict:
+                return self._Dict(value)
+
+            # Every set slot is kept, as when pickled, so that the values
+            # assigned after construction survive. The client handle is
+            # excluded, Load binds the models to a client instead.
+            state: dict = {
+                name: slot
+                for name, slot in value.__getstate__().items()
+                if name != "_client"
+            }
+
+            return [_model, self._Type(value._type), self._Dict(state)]
+        elif (cls is list) or (cls is tuple):
+            return [_list, *[self.Encode(i) for i in value]]
+        elif isinstance(value, Enum):
+            return [_enum, self._Type(cls.__name__), value.value]
+        elif cls is datetime:
+            return [_datetime, value.isoformat()]
+
+        raise TypeError(f"Object of type {cls.__name__} is not serializable")
+
+    def _Dict(self, value: dict) -> list:
+        keys: Tuple[Any, ...] = tuple(value)
+
+        if (index := self.keys.get(keys)) is None:
+            index = self.keys[keys] = len(self.keys)
+
+        return [index, *[self.Encode(i) for i in value.values()]]
+
+    def _Type(self, name: str) -> int:
+        if (index := self.types.get(name)) is None:
+            index = self.types[name] = len(self.types)
+
+        return index
+
+    def Document(self, value: Any) -> list:
+        """Encode a value along with the tables which it references."""
+
+        body: Any = self.Encode(value)
+
+        return [[list(keys) for keys in self.keys], list(self.types), body]
+
+
+class _Decoder:
+    """Decodes a value previously encoded by _Encoder."""
+
+    def __init__(self, document: list, client):
+        self.keys: List[List[Any]] = document[0]
+        self.client = client
+
+        models: Dict[str, Type[Object]] = _Models()
+        self.types: List[type] = []
+        self.references: List[Any] = []
+
+        for name in document[1]:
+            if (cls := models.get(name)) is None:
+                cls = getattr(enums, name, None)
+
+                if (isinstance(cls, type) is False) or (issubclass(cls, Enum) is False):
+                    raise ClientException(f"Cannot deserialize unknown type {name}")
+
+            self.types.append(cls)
+
+    def Decode(self, value: Any) -> Any:
+        if type(value) is not list:
+            return value
+        elif (index := value[0]) == _list:
+            return [self.Decode(i) for i in islice(value, 1, None)]
+        elif index == _reference:
+            return self.references[value[1]]
+        elif index == _enum:
+            return self.types[value[1]](value[2])
+        elif index == _datetime:
+            return datetime.fromisoformat(value[1])
+        elif index == _model:
+            # The model is referenceable before its state is decoded, in the
+            # same order as it was encoded.
+            model: Object = self.types[value[1]].fromRaw(None, None)
+            self.references.append(model)
+
+            model.__setstate__(self._Dict(value[2]))
+            model._client = self.client
+
+            return model
+
+        reference: int = len(self.references)
+        self.references.append(None)
+        self.references[reference] = result = self._Dict(value)
+
+        return result
+
+    def _Dict(self, value: list) -> dict:
+        return dict(zip(self.keys[value[0]], map(self.Decode, islice(value, 1, None))))
+
+
+def Dump(value: Any, **kwargs) -> bytes:
+    """
+    Serialize a model, or any JSON compatible data containing models, to a
+    compact binary representation for transfer between processes or storage.
+
+    Dicts are stored as arrays of their values which reference a shared table
+    of keys, rather than repeating the keys of every dict. msgpack is used
+    when installed, otherwise compact JSON. Models keep every set slot, as
+    when pickled, except for the client handle, Load binds the models to a
+    client instead.
+
+    Parameters
+    ----------
+    value : any
+        Model, or JSON compatible data containing models, to serialize.
+    binary : bool, optional
+        Boolean indicating whether or not msgpack is used when installed
+        (default is True.)
+
+    Returns
+    -------
+    bytes
+        Serialized representation of the value.
+    """
+
+    document: list = _Encoder().Document(value)
+
+    if (msgpack is not None) and (kwargs.get("binary", True) is True):
+        return _msgpack + msgpack.packb(document, use_bin_type=True)
+
+    return _json + json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def Load(data: bytes, client=None) -> Any:
+    """
+    Deserialize data previously serialized by Dump, reconstructing the models
+    which it contains.
+
+    Parameters
+    ----------
+    data : bytes
+        Serialized representation returned by Dump.
+    client : callofduty.Client, optional
+        Client which the reconstructed models are bound to (default is None.)
+
+    Returns
+    -------
+    any
+        Deserialized value.
+    """
+
+    marker: bytes = data[:1]
+
+    if marker == _msgpack:
+        if msgpack is None:
+            raise ClientException("msgpack is required to deserialize this data")
+
+        document: list = msgpack.unpackb(data[1:], raw=False)
+    elif marker == _json:
+        document: list = json.loads(data[1:].decode("utf-8"))
+    else:
+        raise ClientException("Data was not serialized by callofduty.serialize.Dump")
+
+    return _Decoder(document, client).Decode(document[2])
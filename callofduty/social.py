@@ -0,0 +1,171 @@
+import logging
+import time
+from typing import List, Optional, Tuple
+
+from .object import Object
+from .player import Player
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class SocialSnapshot(Object):
+    """
+    Represents a snapshot of the authenticated Call of Duty player's
+    Friends compendium. Each view is only parsed upon first access.
+
+    Parameters
+    ----------
+    data : dict
+        JSON data of the Friends compendium.
+    created : float
+        Monotonic time at which the compendium was requested.
+    friends : list
+        Array of Player objects for the friends.
+    incoming : list
+        Array of Player objects for the incoming Friend Requests.
+    outgoing : list
+        Array of Player objects for the outgoing Friend Requests.
+    blocked : list
+        Array of Player objects for the blocked players.
+    identities : list
+        Array of Player objects for the first-party identities of the friends.
+    """
+
+    _type: str = "SocialSnapshot"
+    _transient: Tuple[str, ...] = ("created",)
+    __slots__ = ("data", "created", "_friends", "_incoming", "_outgoing", "_blocked")
+
+    def __init__(self, client, data: dict, created: float):
+        super().__init__(client, data)
+
+        self.data: dict = data
+        self.created: float = created
+
+        self._friends: Optional[List[Player]] = None
+        self._incoming: Optional[List[Player]] = None
+        self._outgoing: Optional[List[Player]] = None
+        self._blocked: Optional[List[Player]] = None
+
+    @classmethod
+    def fromRaw(cls, client, data: dict) -> "SocialSnapshot":
+        # Monotonic times are not comparable between processes, so a
+        # reconstructed snapshot is considered created upon reconstruction.
+        return cls(client, data, time.monotonic())
+
+    @property
+    def friends(self) -> List[Player]:
+        if self._friends is None:
+            friends: List[Player] = []
+
+            for friend in self.data["uno"]:
+                friends.append(
+                    Player(
+                        self._client,
+                        {
+                            "platform": friend["platform"],
+                            "username": friend["username"],
+                            "accountId": friend.get("accountId"),
+                            "online": friend["status"]["online"],
+                        },
+                    )
+                )
+
+            for _platform in self.data["firstParty"]:
+                for friend in self.data["firstParty"][_platform]:
+                    i: list = friend.get("identities", [])
+                    identities: List[Player] = []
+
+                    for _platform in i:
+                        identities.append(
+                            Player(
+                                self._client,
+                                {
+                                    "platform": friend["identities"][_platform][
+                                        "platform"
+                                    ],
+                                    "username": friend["identities"][_platform].get(
+                                        "username"
+                                    ),
+                                    "accountId": friend["identities"][_platform][
+                                        "accountId"
+                                    ],
+                                    "avatarUrl": friend["identities"][_platform].get(
+                                        "avatarUrlLargeSsl"
+                                    ),
+                                },
+                            )
+                        )
+
+                    friends.append(
+                        Player(
+                            self._client,
+                            {
+                                "platform": friend["platform"],
+                                "username": friend["username"],
+                                "accountId": friend.get("accountId"),
+                                "avatarUrl": friend.get("avatarUrlLargeSsl"),
+                                "online": friend["status"]["online"],
+                                "identities": identities,
+                            },
+                        )
+                    )
+
+            self._friends = self._client._Record(friends)
+
+        return self._friends
+
+    @property
+    def incoming(self) -> List[Player]:
+        if self._incoming is None:
+            self._incoming = self._client._Record(
+                self._CreatePlayers(self.data["incomingInvitations"])
+            )
+
+        return self._incoming
+
+    @property
+    def outgoing(self) -> List[Player]:
+        if self._outgoing is None:
+            self._outgoing = self._client._Record(
+                self._CreatePlayers(self.data["outgoingInvitations"])
+            )
+
+        return self._outgoing
+
+    @property
+    def blocked(self) -> List[Player]:
+        if self._blocked is None:
+            self._blocked = self._client._Record(
+                self._CreatePlayers(self.data.get("blocked", []))
+            )
+
+        return self._blocked
+
+    @property
+    def identities(self) -> List[Player]:
+        identities: List[Player] = []
+
+        for friend in self.friends:
+            identities.extend(friend.identities)
+
+        return identities
+
+    def _CreatePlayers(self, data: list) -> List[Player]:
+        """Create Player objects from an array of compendium entries."""
+
+        players: List[Player] = []
+
+        for entry in data:
+            players.append(
+                Player(
+                    self._client,
+                    {
+                        "platform": entry["platform"],
+                        "username": entry["username"],
+                        "accountId": entry.get("accountId"),
+                        "online": entry.get("status", {}).get("online", False),
+                    },
+                )
+            )
+
+        return players
@@ -1,7 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from .object import Object
+from .object import Hydrator, Object
 from .player import Player
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -36,45 +36,57 @@ class Squad(Object):
     """
 
     _type: str = "Squad"
+    _fields: Dict[str, Hydrator] = {
+        "id": lambda self, data: data["hash"],
+        "name": lambda self, data: data["name"],
+        "description": lambda self, data: data.get("description"),
+        "avatarUrl": lambda self, data: data.get("avatarUrl"),
+        "created": lambda self, data: data.get("created"),
+        "new": lambda self, data: data.get("newlyFormed", False),
+        "private": lambda self, data: data.get("private", False),
+        "points": lambda self, data: data.get("points"),
+        "owner": lambda self, data: self._CreatePlayer(data["creator"]),
+        "members": lambda self, data: [
+            self._CreatePlayer(member) for member in data["members"]
+        ],
+    }
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "avatarUrl",
+        "created",
+        "new",
+        "private",
+        "points",
+        "owner",
+        "members",
+    )
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.id: str = data.pop("hash")
-        self.name: str = data.pop("name")
-        self.description: Optional[str] = data.pop("description", None)
-        self.avatarUrl: Optional[str] = data.pop("avatarUrl", None)
-        self.created: Optional[str] = data.pop("created", None)
-        self.new: bool = data.pop("newlyFormed", False)
-        self.private: bool = data.pop("private", False)
-        self.points: Optional[int] = data.pop("points", None)
+    id: str
+    name: str
+    description: Optional[str]
+    avatarUrl: Optional[str]
+    created: Optional[str]
+    new: bool
+    private: bool
+    points: Optional[int]
+    owner: Player
+    members: List[Player]
 
+    def _CreatePlayer(self, data: dict) -> Player:
         # The Squads endpoints do not follow the same structure as the rest,
         # so the following is a hacky solution to that problem...
-        self.owner: Player = Player(
-            client,
+        return Player(
+            self._client,
             {
-                "platform": data["creator"]["platform"],
-                "username": data["creator"]["gamerTag"],
-                "accountId": data["creator"]["platformId"],
-                "avatarUrl": data["creator"]["avatarUrl"],
+                "platform": data["platform"],
+                "username": data["gamerTag"],
+                "accountId": data["platformId"],
+                "avatarUrl": data["avatarUrl"],
             },
         )
 
-        self.members: List[Player] = []
-        for member in data["members"]:
-            self.members.append(
-                Player(
-                    client,
-                    {
-                        "platform": member["platform"],
-                        "username": member["gamerTag"],
-                        "accountId": member["platformId"],
-                        "avatarUrl": member["avatarUrl"],
-                    },
-                )
-            )
-
     async def join(self):
         """Join the Call of Duty Squad."""
 
@@ -1,9 +1,10 @@
 import logging
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from .enums import Mode, Platform, Title
-from .object import Object
+from .object import Hydrator, Object
 from .player import Player
+from .utils import Convert
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -35,30 +36,57 @@ class AuthenticityStamp(Object):
     """
 
     _type: str = "AuthenticityStamp"
+    _fields: Dict[str, Hydrator] = {
+        "platform": lambda self, data: Convert(Platform, data["platform"]),
+        "username": lambda self, data: data["username"],
+        "title": lambda self, data: Convert(Title, data["title"]),
+        "mode": lambda self, data: Convert(Mode, data["mode"]),
+        "players": lambda self, data: self._Record(
+            [
+                Player(
+                    self._client, {"platform": data["platform"], "username": _player}
+                )
+                for _player in data["partyMembers"]
+            ]
+        ),
+        "playersLeft": lambda self, data: self._Record(
+            [
+                Player(
+                    self._client, {"platform": data["platform"], "username": _player}
+                )
+                for _player in data["partyMembersLeft"]
+            ]
+        ),
+        "data": lambda self, data: {
+            key: value
+            for key, value in data.items()
+            if (key not in AuthenticityStamp._fieldKeys)
+            and (isinstance(value, dict) is False)
+            and (isinstance(value, list) is False)
+        },
+        "settings": lambda self, data: data["gameSettings"],
+        "stats": lambda self, data: data["playerStats"],
+    }
+    # Keys of the JSON data which are represented by other fields.
+    _fieldKeys: Tuple[str, ...] = ("platform", "username", "title", "mode")
+    __slots__ = (
+        "platform",
+        "username",
+        "title",
+        "mode",
+        "players",
+        "playersLeft",
+        "data",
+        "settings",
+        "stats",
+    )
 
-    def __init__(self, client, data: dict):
-        super().__init__(client)
-
-        self.platform: Platform = Platform(data.pop("platform"))
-        self.username: str = data.pop("username")
-        self.title: Title = Title(data.pop("title"))
-        self.mode: Mode = Mode(data.pop("mode"))
-        self.players: List[Player] = []
-        self.playersLeft: List[Player] = []
-        self.data: Dict[str, Union[int, str, bool, None]] = {}
-        self.settings: Dict[str, Union[float, bool]] = data.pop("gameSettings")
-        self.stats: Dict[str, Union[float]] = data.pop("playerStats")
-
-        for _player in data.pop("partyMembers"):
-            self.players.append(
-                Player(self, {"platform": self.platform, "username": _player})
-            )
-
-        for _player in data.pop("partyMembersLeft"):
-            self.players.append(
-                Player(self, {"platform": self.platform, "username": _player})
-            )
-
-        for key in data:
-            if (isinstance(data[key], dict) is False) and (isinstance(data[key], list) is False):
-                self.data[key] = data[key]
+    platform: Platform
+    username: str
+    title: Title
+    mode: Mode
+    players: List[Player]
+    playersLeft: List[Player]
+    data: Dict[str, Union[int, str, bool, None]]
+    settings: Dict[str, Union[float, bool]]
+    stats: Dict[str, Union[float]]
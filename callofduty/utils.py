@@ -1,5 +1,7 @@
 import logging
 import re
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Tuple, Type, TypeVar
 
 from .enums import GameType, Language, Mode, Platform, Reaction, TimeFrame, Title
 from .errors import (
@@ -14,6 +16,88 @@ from .errors import (
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Regex is hideous, but this gets the job done faster than an external
+# library. This is also future-proof against any sort of HTML characters,
+# such as &nbsp and &amp. Tags are stripped before entities, as a pattern
+# without alternation is much faster for large bodies.
+_tags: re.Pattern = re.compile("<[^>\x00]*>")
+_entities: re.Pattern = re.compile("&(?:[a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});")
+_separator: str = "\x00"
+
+E = TypeVar("E", bound=Enum)
+
+
+def _Lookup(enum: Type[E]) -> Dict[Any, E]:
+    """Map both the members of an enum and their values to the members."""
+
+    lookup: Dict[Any, E] = {member.value: member for member in enum}
+    lookup.update({member: member for member in enum})
+
+    return lookup
+
+
+# Precomputed once so that conversion and validation are single dict hits,
+# rather than a scan of the enum members upon every call.
+_lookups: Dict[Type[Enum], Dict[Any, Enum]] = {
+    enum: _Lookup(enum)
+    for enum in (GameType, Language, Mode, Platform, Reaction, TimeFrame, Title)
+}
+_members: Dict[Type[Enum], FrozenSet[Enum]] = {
+    enum: frozenset(enum) for enum in _lookups
+}
+
+# Modes which are known not to exist for a title, such as Zombies in Modern
+# Warfare, every other combination is left for the API to decide. Blackout
+# is also the mode of Warzone ("wz") in Modern Warfare.
+_invalidTitleModes: FrozenSet[Tuple[Title, Mode]] = frozenset(
+    (
+        (Title.ModernWarfare, Mode.Zombies),
+        (Title.WWII, Mode.Blackout),
+        (Title.InfiniteWarfare, Mode.Blackout),
+        (Title.BlackOps3, Mode.Blackout),
+    )
+)
+
+
+def Convert(enum: Type[E], value: Any) -> E:
+    """
+    Convert a value, or a member, of an enum to the member.
+
+    Parameters
+    ----------
+    enum : type
+        Enum to convert the value to, such as callofduty.Platform.
+    value : any
+        Value of the enum member.
+
+    Returns
+    -------
+    enum
+        Member of the enum.
+
+    Raises
+    ------
+    ValueError
+        If the value is not present in the enum.
+    """
+
+    try:
+        return _lookups[enum][value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid {enum.__name__}") from None
+
+
+def _IsMember(enum: Type[Enum], value: Any) -> bool:
+    """Determine whether a value is a member of an enum."""
+
+    return value in _members[enum]
+
+
+def _Name(value: Any) -> str:
+    """Get the name of an enum member, or the representation of any other value."""
+
+    return getattr(value, "name", repr(value))
+
 
 def VerifyPlatform(value: Platform):
     """
@@ -26,8 +110,8 @@ def VerifyPlatform(value: Platform):
         Value to confirm is present in the Platform enum.
     """
 
-    if value not in Platform:
-        raise InvalidPlatform(f"{value.name} is not a valid platform")
+    if _IsMember(Platform, value) is False:
+        raise InvalidPlatform(f"{_Name(value)} is not a valid platform")
 
 
 def VerifyTitle(value: Title):
@@ -41,8 +125,8 @@ def VerifyTitle(value: Title):
         Value to confirm is present in the Title enum.
     """
 
-    if value not in Title:
-        raise InvalidTitle(f"{value.name} is not a valid title")
+    if _IsMember(Title, value) is False:
+        raise InvalidTitle(f"{_Name(value)} is not a valid title")
 
 
 def VerifyMode(value: Mode, title: Title):
@@ -58,11 +142,9 @@ def VerifyMode(value: Mode, title: Title):
         Title to confirm is compatible with the Mode.
     """
 
-    if value not in Mode:
-        raise InvalidMode(f"{value.name} is not a valid mode")
-    elif (value == Mode.Zombies) and (title == Title.ModernWarfare):
-        raise InvalidMode(f"{value.name} is not a valid mode for title {title.name}")
-    elif (value == Mode.Blackout) and (title != Title.BlackOps4):
+    if _IsMember(Mode, value) is False:
+        raise InvalidMode(f"{_Name(value)} is not a valid mode")
+    elif (title, value) in _invalidTitleModes:
         raise InvalidMode(f"{value.name} is not a valid mode for title {title.name}")
 
 
@@ -77,8 +159,8 @@ def VerifyLanguage(value: Language):
         Value to confirm is present in the Language enum.
     """
 
-    if value not in Language:
-        raise InvalidLanguage(f"{value.name} is not a valid language")
+    if _IsMember(Language, value) is False:
+        raise InvalidLanguage(f"{_Name(value)} is not a valid language")
 
 
 def VerifyTimeFrame(value: TimeFrame):
@@ -92,8 +174,8 @@ def VerifyTimeFrame(value: TimeFrame):
         Value to confirm is present in the TimeFrame enum.
     """
 
-    if value not in TimeFrame:
-        raise InvalidTimeFrame(f"{value.name} is not a valid time frame")
+    if _IsMember(TimeFrame, value) is False:
+        raise InvalidTimeFrame(f"{_Name(value)} is not a valid time frame")
 
 
 def VerifyGameType(value: GameType):
@@ -107,8 +189,8 @@ def VerifyGameType(value: GameType):
         Value to confirm is present in the GameType enum.
     """
 
-    if value not in GameType:
-        raise InvalidGameType(f"{value.name} is not a valid game type")
+    if _IsMember(GameType, value) is False:
+        raise InvalidGameType(f"{_Name(value)} is not a valid game type")
 
 
 def VerifyReaction(value: Reaction):
@@ -122,8 +204,8 @@ def VerifyReaction(value: Reaction):
         Value to confirm is present in the Reaction enum.
     """
 
-    if value not in Reaction:
-        raise InvalidReaction(f"{value.name} is not a valid reaction")
+    if _IsMember(Reaction, value) is False:
+        raise InvalidReaction(f"{_Name(value)} is not a valid reaction")
 
 
 def StripHTML(input: str) -> str:
@@ -141,11 +223,34 @@ def StripHTML(input: str) -> str:
         Input string without the HTML formatting.
     """
 
-    # Regex is hideous, but this gets the job done faster than an external
-    # library. This is also future-proof against any sort of HTML characters,
-    # such as &nbsp and &amp.
-    expression: re.Pattern[str] = re.compile(
-        "<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});"
-    )
+    if "<" in input:
+        input = _tags.sub("", input)
+
+    if "&" in input:
+        input = _entities.sub("", input)
+
+    return input
+
+
+def StripHTMLMany(inputs: List[str]) -> List[str]:
+    """
+    Strip the HTML formatting from multiple strings at once, which is faster
+    than stripping each string individually.
+
+    Parameters
+    ----------
+    inputs : list
+        HTML formatted strings.
+
+    Returns
+    -------
+    list
+        Input strings without the HTML formatting, in the same order.
+    """
+
+    # The strings are joined by a separator which tags cannot span, so that
+    # they are stripped in a single pass, unless a string contains it.
+    if any(_separator in input for input in inputs):
+        return [StripHTML(input) for input in inputs]
 
-    return re.sub(expression, "", input)
+    return StripHTML(_separator.join(inputs)).split(_separator)
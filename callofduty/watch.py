@@ -0,0 +1,675 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .enums import Mode, Platform, SquadChange, Title
+from .feed import FeedItem
+from .player import Player
+from .squad import Squad
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+def AdaptInterval(
+    interval: float, changed: bool, minInterval: float, maxInterval: float
+) -> float:
+    """
+    Determine the next polling interval, halving it when the polled data
+    changed and backing off by half again when it did not.
+
+    Parameters
+    ----------
+    interval : float
+        Current polling interval in seconds.
+    changed : bool
+        Boolean indicating whether or not the last poll found changes.
+    minInterval : float
+        Minimum polling interval in seconds.
+    maxInterval : float
+        Maximum polling interval in seconds.
+
+    Returns
+    -------
+    float
+        Next polling interval in seconds.
+    """
+
+    if changed:
+        return max(minInterval, interval / 2)
+
+    return min(maxInterval, interval * 1.5)
+
+
+class Watcher:
+    """
+    Base class for watchers which periodically poll the Call of Duty API
+    and emit events for the changes they find.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    callback : callable, optional
+        Function or coroutine function which is called with each event
+        (default is None.)
+    queue : asyncio.Queue, optional
+        Queue which each event is put into (default is a new queue when
+        no callback is provided, otherwise None.)
+    interval : float, optional
+        Initial polling interval in seconds (default is 10.)
+    minInterval : float, optional
+        Minimum polling interval in seconds (default is 5.)
+    maxInterval : float, optional
+        Maximum polling interval in seconds (default is 120.)
+    """
+
+    def __init__(self, client, **kwargs):
+        self._client = client
+
+        self.callback: Optional[Callable[[Any], Any]] = kwargs.get("callback")
+        self.queue: Optional[asyncio.Queue] = kwargs.get(
+            "queue", asyncio.Queue() if self.callback is None else None
+        )
+        self.interval: float = kwargs.get("interval", 10)
+        self.minInterval: float = kwargs.get("minInterval", 5)
+        self.maxInterval: float = kwargs.get("maxInterval", 120)
+
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return (self._task is not None) and (not self._task.done())
+
+    def Start(self) -> asyncio.Task:
+        """
+        Start polling in the background.
+
+        Returns
+        -------
+        asyncio.Task
+            Task which is running the watcher.
+        """
+
+        if not self.running:
+            self._task = asyncio.ensure_future(self._Run())
+
+        return self._task
+
+    async def Stop(self):
+        """Stop polling and wait for the background task to finish."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def _Run(self):
+        while True:
+            try:
+                changed: bool = await self._Tick()
+            except Exception as e:
+                log.warning(f"{self.__class__.__name__} poll failed, {e}")
+
+                changed: bool = False
+
+            self.interval = AdaptInterval(
+                self.interval, changed, self.minInterval, self.maxInterval
+            )
+
+            await asyncio.sleep(self.interval)
+
+    async def _Tick(self) -> bool:
+        """Poll once, returning whether or not any changes were found."""
+
+        raise NotImplementedError
+
+    async def _Emit(self, event: Any):
+        if self.queue is not None:
+            await self.queue.put(event)
+
+        if self.callback is not None:
+            result: Any = self.callback(event)
+
+            if asyncio.iscoroutine(result):
+                await result
+
+
+class FeedPoller(Watcher):
+    """
+    Incrementally poll the Friend Feed of the authenticated Call of Duty
+    player, emitting a FeedItem for each new feed event.
+
+    Feed events are tracked using a high-water mark on their date and a set
+    of recently seen events, so only new events are parsed.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    emitExisting : bool, optional
+        Boolean indicating whether or not the events present upon the first
+        poll are emitted (default is False.)
+    history : int, optional
+        Number of recently seen events to remember (default is 512.)
+    **kwargs
+        Options which are passed to the Watcher, see callofduty.Watcher.
+    """
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+
+        self.emitExisting: bool = kwargs.get("emitExisting", False)
+        self.watermark: Optional[int] = None
+
+        history: int = kwargs.get("history", 512)
+        self._recent: Deque[Tuple] = deque(maxlen=history)
+        self._recentSet: Set[Tuple] = set()
+
+    async def Poll(self) -> List[FeedItem]:
+        """
+        Request the Friend Feed once and emit its new events.
+
+        Returns
+        -------
+        list
+            Array of FeedItem objects for the new events, oldest first.
+        """
+
+        data: list = (await self._client.http.GetFriendFeed())["data"]["events"]
+
+        watermark: Optional[int] = self.watermark
+        new: List[dict] = []
+
+        for event in data:
+            date: int = event["date"]
+
+            if (watermark is not None) and (date < watermark):
+                continue
+
+            key: Tuple = (
+                event["platform"],
+                event["username"],
+                event["title"],
+                event["category"],
+                date,
+            )
+
+            if key in self._recentSet:
+                continue
+
+            self._Remember(key)
+            new.append(event)
+
+        # An empty feed still primes the watermark, so that everything which
+        # arrives afterwards is new.
+        self.watermark = max([watermark or 0] + [event["date"] for event in new])
+
+        if (watermark is None) and (not self.emitExisting):
+            return []
+
+        # Only the new events are parsed, everything else was seen before.
+        items: List[FeedItem] = [
+            FeedItem(self._client, event)
+            for event in sorted(new, key=lambda e: e["date"])
+        ]
+
+        for item in items:
+            await self._Emit(item)
+
+        return items
+
+    async def _Tick(self) -> bool:
+        return len(await self.Poll()) > 0
+
+    def _Remember(self, key: Tuple):
+        if len(self._recent) == self._recent.maxlen:
+            self._recentSet.discard(self._recent[0])
+
+        self._recent.append(key)
+        self._recentSet.add(key)
+
+
+def DiffProfiles(old: Any, new: Any, path: str = "") -> List["ProfileDelta"]:
+    """
+    Compare two player profiles, returning the differences between them
+    at the level of individual fields.
+
+    Parameters
+    ----------
+    old : dict
+        JSON data of the previous profile.
+    new : dict
+        JSON data of the current profile.
+    path : str, optional
+        Path of the compared values, used when recursing (default is "".)
+
+    Returns
+    -------
+    list
+        Array of ProfileDelta objects, one for each changed field.
+    """
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        deltas: List[ProfileDelta] = []
+
+        for key in old.keys() | new.keys():
+            deltas.extend(
+                DiffProfiles(
+                    old.get(key), new.get(key), f"{path}.{key}" if path else str(key)
+                )
+            )
+
+        return deltas
+
+    if old != new:
+        return [ProfileDelta(path, old, new)]
+
+    return []
+
+
+class ProfileDelta:
+    """
+    Represents a change to a single field of a player's profile.
+
+    Parameters
+    ----------
+    path : str
+        Dot-separated path of the changed field, such as lifetime.all.properties.kills
+    old : object
+        Previous value of the field, None if it was added.
+    new : object
+        Current value of the field, None if it was removed.
+    """
+
+    __slots__ = ("path", "old", "new")
+
+    def __init__(self, path: str, old: Any, new: Any):
+        self.path: str = path
+        self.old: Any = old
+        self.new: Any = new
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.path}: {self.old!r} -> {self.new!r}>"
+
+
+class ProfileChange:
+    """
+    Represents a change to a tracked player's profile.
+
+    Parameters
+    ----------
+    platform : callofduty.Platform
+        Platform of the player.
+    username : str
+        Player's username for the designated platform.
+    deltas : list
+        Array of ProfileDelta objects for the changed fields.
+    profile : dict
+        JSON data of the player's current profile.
+    """
+
+    __slots__ = ("platform", "username", "deltas", "profile")
+
+    def __init__(
+        self,
+        platform: Platform,
+        username: str,
+        deltas: List[ProfileDelta],
+        profile: dict,
+    ):
+        self.platform: Platform = platform
+        self.username: str = username
+        self.deltas: List[ProfileDelta] = deltas
+        self.profile: dict = profile
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.platform.name}/{self.username} ({len(self.deltas)} changes)>"
+
+
+class _TrackedProfile:
+    __slots__ = ("interval", "due", "profile")
+
+    def __init__(self, interval: float):
+        self.interval: float = interval
+        self.due: float = time.monotonic()
+        self.profile: Optional[dict] = None
+
+
+class ProfileWatcher(Watcher):
+    """
+    Periodically poll the profiles of tracked Call of Duty players,
+    emitting a ProfileChange when a player's stats change.
+
+    The lifetime stats of each profile are compared before any deep
+    comparison is made. Each player has their own polling interval which
+    shortens while their stats change and lengthens while they don't, so
+    active players are polled often and dormant players rarely.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    title : callofduty.Title
+        Call of Duty title to get the players' profiles from.
+    mode: callofduty.Mode
+        Call of Duty mode to get the players' profiles from.
+    concurrency : int, optional
+        Maximum number of profiles which are requested at once (default is 10.)
+    **kwargs
+        Options which are passed to the Watcher, see callofduty.Watcher.
+        For profiles, interval defaults to 300, minInterval to 60 and
+        maxInterval to 3600.
+    """
+
+    def __init__(self, client, title: Title, mode: Mode, **kwargs):
+        kwargs.setdefault("interval", 300)
+        kwargs.setdefault("minInterval", 60)
+        kwargs.setdefault("maxInterval", 3600)
+
+        super().__init__(client, **kwargs)
+
+        self.title: Title = title
+        self.mode: Mode = mode
+        self.concurrency: int = kwargs.get("concurrency", 10)
+
+        self._tracked: Dict[Tuple[Platform, str], _TrackedProfile] = {}
+
+    def Track(self, platform: Platform, username: str):
+        """
+        Begin tracking the profile of the specified player.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+        """
+
+        if (platform, username) not in self._tracked:
+            self._tracked[(platform, username)] = _TrackedProfile(self.interval)
+
+    def Untrack(self, platform: Platform, username: str):
+        """
+        Stop tracking the profile of the specified player.
+
+        Parameters
+        ----------
+        platform : callofduty.Platform
+            Platform of the player.
+        username : str
+            Player's username for the designated platform.
+        """
+
+        self._tracked.pop((platform, username), None)
+
+    async def Poll(self) -> List[ProfileChange]:
+        """
+        Request the profile of every tracked player which is due and emit
+        the changes found.
+
+        Returns
+        -------
+        list
+            Array of ProfileChange objects for the changed profiles.
+        """
+
+        now: float = time.monotonic()
+        due: List[Tuple[Platform, str]] = [
+            key for key, tracked in self._tracked.items() if tracked.due <= now
+        ]
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(key: Tuple[Platform, str]) -> Optional[ProfileChange]:
+            async with semaphore:
+                return await self._Check(key)
+
+        changes: List[ProfileChange] = []
+
+        for change in await asyncio.gather(*[check(key) for key in due]):
+            if change is not None:
+                changes.append(change)
+                await self._Emit(change)
+
+        return changes
+
+    async def _Check(self, key: Tuple[Platform, str]) -> Optional[ProfileChange]:
+        try:
+            profile: dict = await self._client.GetPlayerProfile(
+                key[0], key[1], self.title, self.mode
+            )
+        except Exception as e:
+            log.warning(f"Failed to get profile of {key[1]} ({key[0].name}), {e}")
+
+            profile: Optional[dict] = None
+
+        if (tracked := self._tracked.get(key)) is None:
+            # The player was untracked while their profile was requested.
+            return None
+
+        if profile is None:
+            self._Reschedule(tracked, False)
+
+            return None
+
+        previous: Optional[dict] = tracked.profile
+        changed: bool = (previous is not None) and (
+            previous.get("lifetime", previous) != profile.get("lifetime", profile)
+        )
+
+        tracked.profile = profile
+
+        self._Reschedule(tracked, changed)
+
+        if not changed:
+            return None
+
+        return ProfileChange(key[0], key[1], DiffProfiles(previous, profile), profile)
+
+    def _Reschedule(self, tracked: _TrackedProfile, changed: bool):
+        tracked.interval = AdaptInterval(
+            tracked.interval, changed, self.minInterval, self.maxInterval
+        )
+        tracked.due = time.monotonic() + tracked.interval
+
+    async def _Run(self):
+        while True:
+            try:
+                await self.Poll()
+            except Exception as e:
+                log.warning(f"{self.__class__.__name__} poll failed, {e}")
+
+            # Sleep until the next player is due, but wake up regularly so
+            # that newly tracked players are picked up promptly.
+            now: float = time.monotonic()
+            nextDue: float = min(
+                [tracked.due for tracked in self._tracked.values()],
+                default=now + self.minInterval,
+            )
+
+            await asyncio.sleep(min(self.minInterval, max(0, nextDue - now)))
+
+
+class SquadEvent:
+    """
+    Represents a change to a watched Call of Duty Squad.
+
+    Parameters
+    ----------
+    squad : callofduty.Squad
+        Squad object of the current Squad snapshot.
+    change : callofduty.SquadChange
+        Type of change to the Squad.
+    player : callofduty.Player, optional
+        Player object of the member who joined or left (default is None.)
+    old : int, optional
+        Previous number of points of the Squad (default is None.)
+    new : int, optional
+        Current number of points of the Squad (default is None.)
+    """
+
+    __slots__ = ("squad", "change", "player", "old", "new")
+
+    def __init__(self, squad: Squad, change: SquadChange, **kwargs):
+        self.squad: Squad = squad
+        self.change: SquadChange = change
+        self.player: Optional[Player] = kwargs.get("player")
+        self.old: Optional[int] = kwargs.get("old")
+        self.new: Optional[int] = kwargs.get("new")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.squad.name} {self.change.name}>"
+
+
+class SquadWatcher(Watcher):
+    """
+    Periodically poll watched Call of Duty Squads, emitting a SquadEvent
+    when a member joins or leaves or when the Squad's points change.
+
+    Player objects of members who remain in a Squad are reused between
+    snapshots.
+
+    Parameters
+    ----------
+    client : callofduty.Client
+        Client which manages communication with the Call of Duty API.
+    **kwargs
+        Options which are passed to the Watcher, see callofduty.Watcher.
+        For Squads, interval defaults to 60, minInterval to 30 and
+        maxInterval to 900.
+    """
+
+    def __init__(self, client, **kwargs):
+        kwargs.setdefault("interval", 60)
+        kwargs.setdefault("minInterval", 30)
+        kwargs.setdefault("maxInterval", 900)
+
+        super().__init__(client, **kwargs)
+
+        self.squads: Dict[str, Optional[Squad]] = {}
+
+    def Track(self, name: str):
+        """
+        Begin watching the specified Squad.
+
+        Parameters
+        ----------
+        name : str
+            Name of Squad.
+        """
+
+        self.squads.setdefault(name, None)
+
+    def Untrack(self, name: str):
+        """
+        Stop watching the specified Squad.
+
+        Parameters
+        ----------
+        name : str
+            Name of Squad.
+        """
+
+        self.squads.pop(name, None)
+
+    async def Poll(self) -> List[SquadEvent]:
+        """
+        Request every watched Squad once and emit the changes found.
+
+        Returns
+        -------
+        list
+            Array of SquadEvent objects for the changes.
+        """
+
+        names: List[str] = list(self.squads)
+        results: list = await asyncio.gather(
+            *[self._client.GetSquad(name) for name in names], return_exceptions=True
+        )
+
+        events: List[SquadEvent] = []
+
+        for name, squad in zip(names, results):
+            if isinstance(squad, Exception):
+                log.warning(f"Failed to get Squad {name}, {squad}")
+
+                continue
+
+            if name not in self.squads:
+                # The Squad was untracked while it was requested.
+                continue
+
+            previous: Optional[Squad] = self.squads[name]
+            self.squads[name] = squad
+
+            if previous is not None:
+                events.extend(self.Diff(previous, squad))
+
+        for event in events:
+            await self._Emit(event)
+
+        return events
+
+    @staticmethod
+    def Diff(previous: Squad, squad: Squad) -> List[SquadEvent]:
+        """
+        Compare two snapshots of a Squad, reusing the Player objects of
+        unchanged members in the current snapshot.
+
+        Parameters
+        ----------
+        previous : callofduty.Squad
+            Squad object of the previous snapshot.
+        squad : callofduty.Squad
+            Squad object of the current snapshot.
+
+        Returns
+        -------
+        list
+            Array of SquadEvent objects for the changes.
+        """
+
+        known: Dict[Tuple[Platform, str], Player] = {
+            (member.platform, member.username): member for member in previous.members
+        }
+        current: Set[Tuple[Platform, str]] = set()
+        events: List[SquadEvent] = []
+
+        for i, member in enumerate(squad.members):
+            key: Tuple[Platform, str] = (member.platform, member.username)
+            current.add(key)
+
+            if key in known:
+                squad.members[i] = known[key]
+            else:
+                events.append(SquadEvent(squad, SquadChange.Join, player=member))
+
+        ownerKey: Tuple[Platform, str] = (squad.owner.platform, squad.owner.username)
+        if ownerKey in known:
+            squad.owner = known[ownerKey]
+
+        for key, member in known.items():
+            if key not in current:
+                events.append(SquadEvent(squad, SquadChange.Leave, player=member))
+
+        if previous.points != squad.points:
+            events.append(
+                SquadEvent(
+                    squad, SquadChange.Points, old=previous.points, new=squad.points
+                )
+            )
+
+        return events
+
+    async def _Tick(self) -> bool:
+        return len(await self.Poll()) > 0
@@ -4,7 +4,7 @@ import os
 from dotenv import load_dotenv
 
 import callofduty
-from callofduty import Mode, Platform, Reaction, Title
+from callofduty import Language, Mode, Platform, Reaction, Title
 
 
 async def main():
@@ -255,5 +255,109 @@ async def main():
     # squad = await client.GetSquad("Hmmmm")
     # await squad.report()
 
+    # async for match in client.IterPlayerMatches(
+    #     Platform.Activision, "Yeah#8649242", Title.ModernWarfare, Mode.Multiplayer, windows=4, startTimestamp=1577836800000
+    # ):
+    #     print(f"{match.id} ({match.platform.name})")
+
+    # snapshot = await client.GetSocialSnapshot()
+    # print(f"Friends: {len(snapshot.friends)}, Incoming: {len(snapshot.incoming)}, Outgoing: {len(snapshot.outgoing)}")
+    # for blocked in snapshot.blocked:
+    #     print(f"Blocked: {blocked.username} ({blocked.platform.name})")
+
+    # player = await client.GetPlayer(Platform.PlayStation, "ImMotive__")
+    # data = await player.loadoutsAndUnlocks(Title.BlackOps4)
+    # print(f"Loadouts: {len(data['loadouts'])}, Unlocks: {len(data['unlocks'])}")
+
+    # name = await client.GetLocalizedString("LOADOUT_ITEMS:IW8_AR_KILO433")
+    # print(f"Localized Name: {name}")
+
+    # players = [(Platform.BattleNet, "Mxtive#1930"), (Platform.PlayStation, "ImMotive__")]
+    # async for result in client.GetPlayerProfiles(players, Title.ModernWarfare, Mode.Multiplayer, concurrency=5):
+    #     print(f"{result.username} ({result.platform.name}): {result.outcome.name}")
+
+    # poller = callofduty.FeedPoller(client, callback=lambda item: print(f"{item.player.username}: {item.text}"))
+    # poller.Start()
+    # await asyncio.sleep(60)
+    # await poller.Stop()
+
+    # watcher = callofduty.ProfileWatcher(client, Title.ModernWarfare, Mode.Multiplayer)
+    # watcher.Track(Platform.BattleNet, "Mxtive#1930")
+    # watcher.Start()
+    # change = await watcher.queue.get()
+    # for delta in change.deltas:
+    #     print(f"{change.username}: {delta.path} {delta.old} -> {delta.new}")
+    # await watcher.Stop()
+
+    # async def refresh(player):
+    #     return await player.profile(Title.ModernWarfare, Mode.Multiplayer)
+    # scheduler = callofduty.ActivityScheduler(client, refresh, budget=30, maxStaleness=1800)
+    # for friend in await client.GetMyFriends():
+    #     scheduler.Track(friend)
+    # scheduler.Start()
+
+    # watcher = callofduty.SquadWatcher(client, callback=print)
+    # watcher.Track("Autists")
+    # watcher.Start()
+
+    # for query in ["T", "Tu", "Tus", "Tust"]:
+    #     results = await client.search.Type(Platform.Activision, query, session="example")
+    #     if results is not None:
+    #         print(f"{query}: {[player.username for player in results]}")
+
+    # indexed = callofduty.Client(client.http, identityIndex=True)
+    # accountId = await indexed.ResolveAccountId(Platform.Activision, "Tustin#1365515")
+    # await indexed.AddFriend(accountId)
+    # indexed.identities.Save("identities.json")
+
+    # for attempt in range(2):
+    #     try:
+    #         await client.GetPlayerProfile(Platform.PlayStation, "NotARealPlayer", Title.ModernWarfare, Mode.Multiplayer)
+    #     except callofduty.HTTPException as e:
+    #         print(callofduty.ClassifyError(e), e)
+    # print(f"Cached errors: {len(client.http.negativeCache)}")
+
+    # dashboard = callofduty.Client(client.http, profileTTL=30, leaderboardTTL=300, maxStale=600)
+    # for i in range(3):
+    #     profile = await dashboard.GetPlayerProfile(Platform.BattleNet, "Mxtive#1930", Title.ModernWarfare, Mode.Multiplayer)
+    #     print(profile["level"])
+    #     await asyncio.sleep(30)
+
+    # recording = await callofduty.Login(os.environ["ATVI_EMAIL"], os.environ["ATVI_PASSWORD"], capture="capture.jsonl")
+    # await recording.GetPlayerProfile(Platform.BattleNet, "Mxtive#1930", Title.ModernWarfare, Mode.Multiplayer)
+    # offline = callofduty.Offline("capture.jsonl")
+    # print(await offline.GetPlayerProfile(Platform.BattleNet, "Mxtive#1930", Title.ModernWarfare, Mode.Multiplayer))
+
+    # warm = await callofduty.Login(
+    #     os.environ["ATVI_EMAIL"],
+    #     os.environ["ATVI_PASSWORD"],
+    #     warmUp=True,
+    #     preloadLanguages=[Language.English],
+    #     preloadMaps=[(Title.ModernWarfare, Mode.Multiplayer)],
+    # )
+    # print(await warm.GetAvailableMaps(Title.ModernWarfare))
+    # await warm.Close()
+
+    # lazy = callofduty.Client(client.http, lazy=True)
+    # leaderboard = await lazy.GetLeaderboard(Title.ModernWarfare, Platform.PlayStation)
+    # print([entry.username for entry in leaderboard.entries])
+
+    # leaderboard = await client.GetLeaderboard(Title.ModernWarfare, Platform.PlayStation)
+    # restored = callofduty.Leaderboard.fromRaw(client, leaderboard.toRaw())
+    # print(restored.entries[0].username, leaderboard.raw is restored.raw)
+
+    # interned = callofduty.Client(client.http, internPlayers=True)
+    # friends = (await interned.GetSocialSnapshot()).friends
+    # feed = await interned.GetFriendFeed()
+    # print(len({item.player for item in feed}), [item.player for item in feed if item.player in friends][:1])
+
+    # leaderboard = await client.GetLeaderboard(Title.ModernWarfare, Platform.PlayStation)
+    # data = callofduty.Dump(leaderboard)
+    # print(len(data), callofduty.Load(data, client).entries[0].username)
+
+    # feed = await client.GetFriendFeed()
+    # callofduty.StripFeed(feed)
+    # print([item.text for item in feed][:5])
+
 
 asyncio.get_event_loop().run_until_complete(main())